@@ -0,0 +1,147 @@
+"""
+Precomputed aggregates for the dashboard analytics in app.py.
+"""
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+
+# Categorical dimensions charted in the analytics tabs
+DIMENSIONS = ("Department", "City")
+SALARY_BIN_COUNT = 5
+OTHER_LABEL = "Other"
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Pick the points of a series to keep with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves the visual shape.
+
+    Args:
+        x: X values, sorted ascending
+        y: Y values
+        max_points: Number of points to keep
+
+    Returns:
+        numpy.ndarray: Sorted positions of the kept points
+    """
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    edges[-1] = n - 1
+
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0] = 0
+    a = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    selected[-1] = n - 1
+    return selected
+
+
+def downsample_series(df: pd.DataFrame, x: str, y: str, max_points: int) -> pd.DataFrame:
+    """
+    Reduce an x/y series to at most max_points points for charting.
+
+    Args:
+        df: Source data
+        x: Column used as the chart index
+        y: Column plotted against it
+        max_points: Point budget
+
+    Returns:
+        pandas.DataFrame: ``y`` indexed by ``x``, sorted by ``x``
+    """
+    series = df[[x, y]].dropna().sort_values(x, kind="mergesort")
+    keep = lttb_indices(series[x].to_numpy(), series[y].to_numpy(), max_points)
+    return series.iloc[keep].set_index(x)
+
+
+def top_n_with_other(values: pd.Series, max_categories: int,
+                     weights: Optional[pd.Series] = None) -> pd.Series:
+    """
+    Keep the largest categories of a bar series and fold the rest into "Other".
+
+    Args:
+        values: Per-category values, sorted descending
+        max_categories: Number of bars to draw, including "Other"
+        weights: Per-category row counts; when given the values are means and
+            "Other" is their weighted mean, otherwise "Other" is their sum
+
+    Returns:
+        pandas.Series: At most max_categories bars
+    """
+    if len(values) <= max_categories or max_categories < 2:
+        return values
+
+    top = values.iloc[:max_categories - 1]
+    rest = values.iloc[max_categories - 1:]
+    if weights is None:
+        other = rest.sum()
+    else:
+        rest_weights = weights.reindex(rest.index)
+        other = (rest * rest_weights).sum() / rest_weights.sum()
+    return pd.concat([top, pd.Series([other], index=[OTHER_LABEL], name=values.name)])
+
+
+def compute_dashboard_aggregates(df: pd.DataFrame, max_chart_points: int,
+                                 max_chart_categories: int) -> Dict[str, Any]:
+    """
+    Compute every aggregate the dashboard charts need in one go.
+
+    Each dimension is grouped once, producing both the row count and the mean
+    salary; the salary histogram and overview metrics are computed alongside.
+    Chart series are reduced to the given budgets.
+
+    Args:
+        df: Employee data as loaded from blob storage
+        max_chart_points: Point budget of line charts
+        max_chart_categories: Bar budget of categorical charts
+
+    Returns:
+        dict: ``overview`` metrics, per-dimension ``counts``/``mean_salary``
+        series (sorted descending), the ``salary_distribution`` series and the
+        downsampled ``age_salary`` frame
+    """
+    aggregates = {
+        "overview": {
+            "total_records": len(df),
+            "total_columns": len(df.columns),
+            "average_salary": df["Salary"].mean(),
+            "departments": df["Department"].nunique(),
+        },
+        "counts": {},
+        "mean_salary": {},
+    }
+
+    for dimension in DIMENSIONS:
+        stats = df.groupby(dimension)["Salary"].agg(["size", "mean"])
+        counts = stats["size"].sort_values(ascending=False).rename("count")
+        mean_salary = stats["mean"].sort_values(ascending=False).rename("Salary")
+        aggregates["counts"][dimension] = top_n_with_other(counts, max_chart_categories)
+        aggregates["mean_salary"][dimension] = top_n_with_other(
+            mean_salary, max_chart_categories, weights=stats["size"]
+        )
+
+    # Create salary bins for better visualization
+    salary_bins = pd.cut(df["Salary"], bins=SALARY_BIN_COUNT, precision=0)
+    aggregates["salary_distribution"] = salary_bins.value_counts().sort_index()
+
+    aggregates["age_salary"] = downsample_series(df, "Age", "Salary", max_chart_points)
+
+    return aggregates
@@ -1,8 +1,11 @@
 import streamlit as st
-import pandas as pd
+from analytics import compute_dashboard_aggregates
 from blob_storage import create_blob_manager
 from config import AppConfig
 
+BLOB_LIST_PAGE_SIZE = 50
+ANALYTICS_SECTIONS = ["Department Analysis", "Location Analysis", "Salary Analysis"]
+
 # Get configuration
 config = AppConfig.get_azure_storage_config()
 app_config = AppConfig.get_app_config()
@@ -10,12 +13,21 @@ app_config = AppConfig.get_app_config()
 # Initialize blob storage manager
 blob_manager = create_blob_manager(
     config["storage_account_name"], 
-    config["container_name"]
+    config["container_name"],
+    max_concurrency=config["download_max_concurrency"],
+    chunk_size=config["download_chunk_size"],
+    disk_cache_dir=config["disk_cache_dir"],
+    disk_cache_max_bytes=config["disk_cache_max_bytes"],
+    status_cache_ttl=config["status_cache_ttl"],
+    transport_options=config["transport_options"]
 )
 
-@st.cache_data
 def load_data_from_blob():
-    """Load CSV data from Azure Blob Storage"""
+    """Load CSV data from Azure Blob Storage.
+
+    The blob manager keeps the parsed frame keyed by ETag, so a rerun only
+    costs a conditional request and picks up new uploads automatically.
+    """
     try:
         df = blob_manager.download_csv_as_dataframe(config["blob_name"])
         return df
@@ -23,6 +35,16 @@ def load_data_from_blob():
         st.error(f"Error loading data from blob storage: {str(e)}")
         return None
 
+@st.cache_data(max_entries=4)
+def get_dashboard_aggregates(data_version, _df, max_chart_points, max_chart_categories):
+    """Compute the analytics aggregates once per dataset version (blob ETag)."""
+    return compute_dashboard_aggregates(_df, max_chart_points, max_chart_categories)
+
+@st.cache_data(max_entries=1)
+def get_csv_export(data_version, _df):
+    """Serialise the dataset to CSV once per dataset version (blob ETag)."""
+    return _df.to_csv(index=False)
+
 def main():
     st.title(app_config["title"])
     st.write(app_config["description"])
@@ -51,17 +73,26 @@ def main():
     if df is not None:
         st.success(f"✅ Successfully loaded {len(df)} records from blob storage!")
         
+        data_version = (blob_manager.get_cached_version(config["blob_name"]) or {}).get("etag")
+        aggregates = get_dashboard_aggregates(
+            data_version,
+            df,
+            app_config["max_chart_points"],
+            app_config["max_chart_categories"]
+        )
+        overview = aggregates["overview"]
+        
         # Display basic info
         st.subheader("📈 Dataset Overview")
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Records", len(df))
+            st.metric("Total Records", overview["total_records"])
         with col2:
-            st.metric("Total Columns", len(df.columns))
+            st.metric("Total Columns", overview["total_columns"])
         with col3:
-            st.metric("Average Salary", f"${df['Salary'].mean():,.0f}")
+            st.metric("Average Salary", f"${overview['average_salary']:,.0f}")
         with col4:
-            st.metric("Departments", df['Department'].nunique())
+            st.metric("Departments", overview["departments"])
         
         # Display the data
         st.subheader("👥 Employee Data")
@@ -70,56 +101,58 @@ def main():
         # Show some basic analytics
         st.subheader("📊 Analytics")
         
-        tab1, tab2, tab3 = st.tabs(["Department Analysis", "Location Analysis", "Salary Analysis"])
+        # Unlike st.tabs, which runs every tab on each rerun, only the
+        # selected section is computed and sent to the browser
+        section = st.radio(
+            "Analysis",
+            ANALYTICS_SECTIONS,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="analytics_section"
+        )
         
-        with tab1:
+        if section == "Department Analysis":
             col1, col2 = st.columns(2)
             with col1:
                 st.write("**Employees by Department**")
-                dept_counts = df['Department'].value_counts()
-                st.bar_chart(dept_counts)
+                st.bar_chart(aggregates["counts"]["Department"])
             with col2:
                 st.write("**Average Salary by Department**")
-                dept_salary = df.groupby('Department')['Salary'].mean().sort_values(ascending=False)
-                st.bar_chart(dept_salary)
+                st.bar_chart(aggregates["mean_salary"]["Department"])
         
-        with tab2:
+        elif section == "Location Analysis":
             col1, col2 = st.columns(2)
             with col1:
                 st.write("**Employees by City**")
-                city_counts = df['City'].value_counts()
-                st.bar_chart(city_counts)
+                st.bar_chart(aggregates["counts"]["City"])
             with col2:
                 st.write("**Average Salary by City**")
-                city_salary = df.groupby('City')['Salary'].mean().sort_values(ascending=False)
-                st.bar_chart(city_salary)
+                st.bar_chart(aggregates["mean_salary"]["City"])
         
-        with tab3:
+        elif section == "Salary Analysis":
             col1, col2 = st.columns(2)
             with col1:
                 st.write("**Salary Distribution**")
-                # Create salary bins for better visualization
-                salary_bins = pd.cut(df['Salary'], bins=5, precision=0)
-                salary_counts = salary_bins.value_counts().sort_index()
-                st.bar_chart(salary_counts)
+                st.bar_chart(aggregates["salary_distribution"])
             with col2:
                 st.write("**Age vs Salary**")
-                # Create a proper scatter plot data structure
-                age_salary_df = df[['Age', 'Salary']].copy()
-                st.line_chart(age_salary_df.set_index('Age'))
+                # Sorted by age and downsampled to the chart point budget
+                st.line_chart(aggregates["age_salary"])
         
-        # Show raw data option
-        with st.expander("🔍 View Raw Data"):
+        # Show raw data option; a toggle (unlike an expander) skips the work when closed
+        if st.toggle("🔍 View Raw Data", key="show_raw_data"):
             st.dataframe(df, use_container_width=True)
             
-            # Download button
-            csv = df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download data as CSV",
-                data=csv,
-                file_name='employee_data.csv',
-                mime='text/csv'
-            )
+            # Serialise the CSV only when asked for, once per dataset version
+            if st.button("📄 Prepare CSV download", key="prepare_csv"):
+                st.session_state.csv_requested = True
+            if st.session_state.get("csv_requested"):
+                st.download_button(
+                    label="📥 Download data as CSV",
+                    data=get_csv_export(data_version, df),
+                    file_name='employee_data.csv',
+                    mime='text/csv'
+                )
     else:
         st.error("Failed to load data. Please check the blob storage configuration.")
         
@@ -131,13 +164,15 @@ def main():
             st.write("4. Confirm the App Service has proper permissions to access storage")
             st.write("5. Check if AZURE_STORAGE_CONNECTION_STRING is properly configured")
             
-            # Show available blobs for debugging
+            # Show available blobs for debugging (first page only)
             try:
                 st.write("**Available blobs in container:**")
-                blobs = blob_manager.list_blobs()
+                blobs, next_page = blob_manager.list_blobs_page(page_size=BLOB_LIST_PAGE_SIZE)
                 if blobs:
                     for blob in blobs:
                         st.write(f"- {blob}")
+                    if next_page:
+                        st.write(f"... showing the first {BLOB_LIST_PAGE_SIZE} blobs")
                 else:
                     st.write("No blobs found in container")
             except Exception as e:
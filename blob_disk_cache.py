@@ -0,0 +1,114 @@
+"""
+Persistent on-disk cache for downloaded blob content.
+
+Entries are raw blob bytes keyed by storage account, container, blob name and
+ETag, so a new worker or scale-out instance can warm up from local disk
+instead of pulling every blob from storage again. Writes are atomic
+(temporary file + rename) and eviction tolerates files disappearing under it,
+which keeps the cache safe to share between several processes.
+
+The cache is only an optimisation: I/O errors (full disk, permissions,
+concurrent deletes) are swallowed and behave like a cache miss.
+"""
+import hashlib
+import os
+from typing import Optional
+
+from file_cache import atomic_write, evict_lru, mark_used, remove_file
+
+CACHE_FILE_SUFFIX = ".blob"
+
+
+class BlobDiskCache:
+    """Size-bounded LRU cache of blob content stored in a local directory."""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize the BlobDiskCache.
+
+        Args:
+            cache_dir: Directory holding the cached blob files (created if missing)
+            max_bytes: Total size the cache may occupy before old entries are evicted
+            
+        Raises:
+            OSError: If the cache directory cannot be created
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        """Hash a key component into a short, filesystem-safe string."""
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+    def _blob_prefix(self, account: str, container: str, blob_name: str) -> str:
+        """Get the file name prefix shared by every cached version of a blob."""
+        return self._digest(f"{account}/{container}/{blob_name}") + "-"
+
+    def _path(self, account: str, container: str, blob_name: str, etag: str) -> str:
+        """Get the cache file path of one blob version."""
+        file_name = self._blob_prefix(account, container, blob_name) + self._digest(etag) + CACHE_FILE_SUFFIX
+        return os.path.join(self.cache_dir, file_name)
+
+    def get(self, account: str, container: str, blob_name: str, etag: str) -> Optional[bytes]:
+        """
+        Read a cached blob version.
+
+        Args:
+            account: Storage account name
+            container: Container name
+            blob_name: Name of the blob
+            etag: ETag of the blob version to read
+
+        Returns:
+            bytes: The cached content, or None if this version is not cached
+            or cannot be read
+        """
+        path = self._path(account, container, blob_name, etag)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        mark_used(path)
+        return content
+
+    def put(self, account: str, container: str, blob_name: str, etag: str, content) -> None:
+        """
+        Store a blob version, replacing older versions of the same blob.
+
+        Args:
+            account: Storage account name
+            container: Container name
+            blob_name: Name of the blob
+            etag: ETag of the blob version being stored
+            content: Blob content (bytes-like)
+        """
+        if len(content) > self.max_bytes:
+            return
+
+        path = self._path(account, container, blob_name, etag)
+        try:
+            atomic_write(self.cache_dir, path, content)
+
+            # Drop stale versions of this blob
+            prefix = self._blob_prefix(account, container, blob_name)
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.startswith(prefix) and entry.path != path:
+                    remove_file(entry.path)
+
+            self.evict()
+        except OSError:
+            # A failed write only costs a future download
+            pass
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in max_bytes."""
+        evict_lru(self.cache_dir, CACHE_FILE_SUFFIX, max_bytes=self.max_bytes)
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(CACHE_FILE_SUFFIX):
+                remove_file(entry.path)
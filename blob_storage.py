@@ -2,51 +2,612 @@
 Azure Blob Storage utilities for the Streamlit app.
 """
 import os
+import threading
+import time
 import pandas as pd
 import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.storage.blob import BlobServiceClient
 from azure.identity import DefaultAzureCredential
+from blob_disk_cache import BlobDiskCache
+
+
+# Process-wide cache of parsed blobs, keyed by (account, container, blob).
+# Each entry holds the ETag/Last-Modified of the version that was parsed and
+# one frame per parse variant (format, column projection), so later loads can
+# issue a conditional request and skip the transfer + parse when the blob has
+# not changed.
+_dataframe_cache: Dict[tuple, Dict[str, Any]] = {}
+_dataframe_cache_lock = threading.Lock()
+
+# Short-lived existence/metadata answers keyed like _dataframe_cache, so status
+# checks repeated on every rerun do not each cost a request.
+_blob_status_cache: Dict[tuple, Dict[str, Any]] = {}
+_blob_status_cache_lock = threading.Lock()
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_STATUS_CACHE_TTL = 30
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+# Trailing bytes kept per cached blob to verify that a grown blob was only appended to
+APPEND_CHECK_BYTES = 256
+# Cache variant of a whole CSV blob parsed with default options
+CSV_VARIANT = ("csv",)
+# Parsed variants (e.g. Parquet column projections) kept per cached blob version
+MAX_CACHED_VARIANTS = 4
+
+# Defaults for the shared HTTP transport; see get_shared_blob_service_client
+DEFAULT_TRANSPORT_OPTIONS = {
+    "pool_size": 16,
+    "connection_timeout": 20,
+    "read_timeout": 60,
+    "retry_total": 3,
+    "max_single_get_size": 32 * 1024 * 1024,
+}
+
+# One BlobServiceClient (and so one keep-alive connection pool) per account and
+# transport settings, shared by every BlobStorageManager in the process.
+_shared_clients: Dict[tuple, Dict[str, Any]] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_blob_service_client(storage_account_name: str,
+                                   connection_string: Optional[str] = None,
+                                   transport_options: Optional[Dict[str, Any]] = None) -> BlobServiceClient:
+    """
+    Get the process-wide BlobServiceClient for a storage account.
+    
+    The client uses a requests session whose connection pool is sized by
+    ``pool_size``, so TLS connections are reused across managers, reruns and
+    download threads.
+    
+    Args:
+        storage_account_name: Name of the Azure Storage Account
+        connection_string: Connection string; None authenticates with DefaultAzureCredential
+        transport_options: Overrides for DEFAULT_TRANSPORT_OPTIONS (pool_size,
+            connection_timeout, read_timeout, retry_total, max_single_get_size)
+        
+    Returns:
+        BlobServiceClient: Shared blob service client
+    """
+    options = {**DEFAULT_TRANSPORT_OPTIONS, **(transport_options or {})}
+    key = (storage_account_name, connection_string, tuple(sorted(options.items())))
+    
+    with _shared_clients_lock:
+        shared = _shared_clients.get(key)
+        if shared is not None:
+            return shared["client"]
+        
+        adapter = HTTPAdapter(
+            pool_connections=options["pool_size"],
+            pool_maxsize=options["pool_size"]
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # The SDK only applies timeouts to transports it builds itself, so they
+        # are set on the supplied transport
+        transport = RequestsTransport(
+            session=session,
+            session_owner=False,
+            connection_timeout=options["connection_timeout"],
+            read_timeout=options["read_timeout"]
+        )
+        client_kwargs = {
+            "transport": transport,
+            "retry_total": options["retry_total"],
+            "max_single_get_size": options["max_single_get_size"],
+        }
+        
+        if connection_string:
+            # Use connection string if available (local dev or explicit config)
+            client = BlobServiceClient.from_connection_string(connection_string, **client_kwargs)
+        else:
+            # Use default Azure credential (Managed Identity in Azure App Service)
+            account_url = f"https://{storage_account_name}.blob.core.windows.net"
+            client = BlobServiceClient(
+                account_url, 
+                credential=DefaultAzureCredential(),
+                **client_kwargs
+            )
+        
+        _shared_clients[key] = {"client": client, "adapter": adapter, "options": options}
+        return client
+
+
+def get_transport_stats() -> List[Dict[str, Any]]:
+    """
+    Get connection pool statistics of every shared blob service client.
+    
+    Returns:
+        list: One dict per shared client with its account, options and per-host
+        pool counters (open connections, requests served, idle connections)
+    """
+    stats = []
+    with _shared_clients_lock:
+        shared_clients = list(_shared_clients.items())
+    for (storage_account_name, _, _), shared in shared_clients:
+        pools = []
+        pool_manager = shared["adapter"].poolmanager
+        for pool_key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            pools.append({
+                "host": pool.host,
+                "connections_opened": pool.num_connections,
+                "requests": pool.num_requests,
+                "idle_connections": pool.pool.qsize() if pool.pool is not None else 0,
+            })
+        stats.append({
+            "storage_account_name": storage_account_name,
+            "options": shared["options"],
+            "pools": pools,
+        })
+    return stats
+
+
+def get_cached_dataframe(cache_key: tuple, variant: tuple) -> Optional[Dict[str, Any]]:
+    """
+    Get a parsed frame from the process-wide blob cache.
+    
+    Args:
+        cache_key: (account, container, blob) of the blob
+        variant: Parse variant, e.g. CSV_VARIANT
+        
+    Returns:
+        dict: ``etag`` of the cached version and its parsed ``df``, or None if
+        this variant is not cached
+    """
+    with _dataframe_cache_lock:
+        entry = _dataframe_cache.get(cache_key)
+        if entry is None or variant not in entry["frames"]:
+            return None
+        return {"etag": entry["etag"], "df": entry["frames"][variant]}
+
+
+def store_cached_dataframe(cache_key: tuple, variant: tuple, df: pd.DataFrame,
+                           properties, content) -> None:
+    """
+    Store a parsed frame in the process-wide blob cache.
+    
+    Frames of other variants are kept while the ETag is unchanged and dropped
+    when the blob has moved on to a new version. At most MAX_CACHED_VARIANTS
+    variants are kept per blob; the least recently stored one is dropped first.
+    
+    Args:
+        cache_key: (account, container, blob) of the blob
+        variant: Parse variant, e.g. CSV_VARIANT
+        df: Parsed frame
+        properties: Blob properties of the downloaded version (etag, last_modified)
+        content: Downloaded blob content
+    """
+    with _dataframe_cache_lock:
+        entry = _dataframe_cache.get(cache_key)
+        if entry is None or entry["etag"] != properties.etag:
+            entry = {
+                "etag": properties.etag,
+                "last_modified": properties.last_modified,
+                "size": len(content),
+                "tail": bytes(content[-APPEND_CHECK_BYTES:]),
+                "frames": {},
+            }
+            _dataframe_cache[cache_key] = entry
+        frames = entry["frames"]
+        # Re-insert so dict order runs from least to most recently stored
+        frames.pop(variant, None)
+        frames[variant] = df
+        while len(frames) > MAX_CACHED_VARIANTS:
+            del frames[next(iter(frames))]
+
+
+def parse_csv_content(content) -> pd.DataFrame:
+    """Parse downloaded CSV content without copying the buffer."""
+    return pd.read_csv(io.BufferedReader(_BufferReader(content)))
+
+
+class _BufferWriter(io.RawIOBase):
+    """Write-only stream that fills a preallocated memoryview in place."""
+    
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        size = len(data)
+        self._view[self._pos:self._pos + size] = data
+        self._pos += size
+        return size
+
+
+class _ChunkStreamReader(io.RawIOBase):
+    """Read-only stream over an iterator of byte chunks (e.g. ``download_blob().chunks()``)."""
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._current = memoryview(b"")
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, target) -> int:
+        while not self._current:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._current = memoryview(chunk)
+        size = min(len(target), len(self._current))
+        target[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
+
+
+class _BufferReader(io.RawIOBase):
+    """Read-only, seekable stream over a buffer that hands out slices without copying it."""
+    
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, min(offset, len(self._view)))
+        return self._pos
+    
+    def readinto(self, target) -> int:
+        size = min(len(target), len(self._view) - self._pos)
+        target[:size] = self._view[self._pos:self._pos + size]
+        self._pos += size
+        return size
 
 
 class BlobStorageManager:
     """Manages Azure Blob Storage operations for the application."""
     
-    def __init__(self, storage_account_name: str, container_name: str):
+    def __init__(self, storage_account_name: str, container_name: str,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 disk_cache: Optional[BlobDiskCache] = None,
+                 status_cache_ttl: float = DEFAULT_STATUS_CACHE_TTL,
+                 transport_options: Optional[Dict[str, Any]] = None):
         """
         Initialize the BlobStorageManager.
         
         Args:
             storage_account_name: Name of the Azure Storage Account
             container_name: Name of the blob container
+            max_concurrency: Number of threads used for ranged downloads
+            chunk_size: Size in bytes of each downloaded range
+            disk_cache: Optional on-disk cache consulted before downloading a blob
+            status_cache_ttl: Seconds an existence/metadata answer is reused
+            transport_options: Connection pool/timeout/retry overrides for the shared client
         """
         self.storage_account_name = storage_account_name
         self.container_name = container_name
+        self.max_concurrency = max(1, max_concurrency)
+        self.chunk_size = chunk_size
+        self.disk_cache = disk_cache
+        self.status_cache_ttl = status_cache_ttl
+        self.transport_options = transport_options
         self.connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
         self._blob_service_client = None
     
     def _get_blob_service_client(self) -> BlobServiceClient:
         """Get the blob service client with appropriate authentication."""
         if self._blob_service_client is None:
-            if self.connection_string:
-                # Use connection string if available (local dev or explicit config)
-                self._blob_service_client = BlobServiceClient.from_connection_string(
-                    self.connection_string
+            self._blob_service_client = get_shared_blob_service_client(
+                self.storage_account_name,
+                self.connection_string,
+                self.transport_options
+            )
+        return self._blob_service_client
+    
+    def _cache_key(self, blob_name: str) -> tuple:
+        """Build the process-wide cache key for a blob in this container."""
+        return (self.storage_account_name, self.container_name, blob_name)
+    
+    def get_cached_version(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the ETag/Last-Modified of the cached copy of a blob.
+        
+        Args:
+            blob_name: Name of the blob
+            
+        Returns:
+            dict: ``etag`` and ``last_modified`` of the cached copy, or None if
+            the blob has not been loaded yet
+        """
+        with _dataframe_cache_lock:
+            entry = _dataframe_cache.get(self._cache_key(blob_name))
+        if entry is None:
+            return None
+        return {"etag": entry["etag"], "last_modified": entry["last_modified"]}
+    
+    def invalidate_cache(self, blob_name: Optional[str] = None) -> None:
+        """
+        Drop cached DataFrames and existence answers so the next load or check asks storage again.
+        
+        Args:
+            blob_name: Blob to drop; if None, drop every cached blob in this container
+        """
+        for cache, lock in ((_dataframe_cache, _dataframe_cache_lock),
+                            (_blob_status_cache, _blob_status_cache_lock)):
+            with lock:
+                if blob_name is not None:
+                    cache.pop(self._cache_key(blob_name), None)
+                    continue
+                for key in list(cache):
+                    if key[:2] == (self.storage_account_name, self.container_name):
+                        del cache[key]
+    
+    def _download_blob_content(self, blob_client, **conditions) -> Tuple[Any, Any]:
+        """
+        Download a whole blob, fetching ranges concurrently for large blobs.
+        
+        The first range is requested on its own (honouring ``conditions``) to
+        learn the blob size and ETag. The remaining ranges are fetched on a
+        thread pool, pinned to that ETag, and written straight into one
+        preallocated buffer.
+        
+        Args:
+            blob_client: Blob client of the blob to download
+            **conditions: Access conditions for the first request (etag, match_condition)
+            
+        Returns:
+            tuple: (content buffer, blob properties)
+            
+        Raises:
+            ResourceNotModifiedError: If a conditional request found the blob unchanged
+        """
+        first = blob_client.download_blob(offset=0, length=self.chunk_size, **conditions)
+        properties = first.properties
+        # For ranged downloads the SDK reports the range size in properties.size;
+        # the full blob size is the tail of Content-Range ("bytes 0-N/<total>")
+        total_size = first.size
+        if properties.content_range:
+            total_size = int(properties.content_range.rsplit("/", 1)[-1])
+        
+        if total_size <= first.size:
+            return first.readall(), properties
+        
+        buffer = bytearray(total_size)
+        view = memoryview(buffer)
+        first.readinto(_BufferWriter(view[:first.size]))
+        
+        def fetch_range(offset: int) -> None:
+            length = min(self.chunk_size, total_size - offset)
+            part = blob_client.download_blob(
+                offset=offset,
+                length=length,
+                etag=properties.etag,
+                match_condition=MatchConditions.IfNotModified
+            )
+            part.readinto(_BufferWriter(view[offset:offset + length]))
+        
+        offsets = range(first.size, total_size, self.chunk_size)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # list() re-raises the first failed range
+            list(executor.map(fetch_range, offsets))
+        
+        return buffer, properties
+    
+    def _fetch_blob_content(self, blob_name: str, blob_client, **conditions) -> Tuple[Any, Any]:
+        """
+        Get a blob's content from the disk cache or, failing that, from storage.
+        
+        Without access conditions the current ETag is looked up first (a
+        metadata-only request) and the matching disk entry is used if present.
+        Content downloaded from storage is written back to the disk cache.
+        
+        Args:
+            blob_name: Name of the blob
+            blob_client: Blob client of the blob to download
+            **conditions: Access conditions for the download (etag, match_condition)
+            
+        Returns:
+            tuple: (content buffer, blob properties)
+            
+        Raises:
+            ResourceNotModifiedError: If a conditional request found the blob unchanged
+        """
+        if self.disk_cache is None:
+            return self._download_blob_content(blob_client, **conditions)
+        
+        if not conditions:
+            properties = blob_client.get_blob_properties()
+            content = self.disk_cache.get(
+                self.storage_account_name, self.container_name, blob_name, properties.etag
+            )
+            if content is not None:
+                return content, properties
+            conditions = {
+                "etag": properties.etag,
+                "match_condition": MatchConditions.IfNotModified,
+            }
+        
+        content, properties = self._download_blob_content(blob_client, **conditions)
+        self.disk_cache.put(
+            self.storage_account_name, self.container_name, blob_name, properties.etag, content
+        )
+        return content, properties
+    
+    def _load_dataframe_cached(self, blob_name: str, variant: tuple,
+                               parse: Callable[[Any], pd.DataFrame],
+                               use_cache: bool = True) -> pd.DataFrame:
+        """
+        Download and parse a blob, reusing the cached frame while its ETag is unchanged.
+        
+        Each cached blob keeps one parsed frame per ``variant`` (format plus any
+        column projection). A conditional If-None-Match request is only sent
+        when the requested variant is already cached; otherwise the blob is
+        downloaded and the new frame is stored next to the existing variants,
+        or replaces them if the ETag has moved on.
+        
+        Args:
+            blob_name: Name of the blob file to download
+            variant: Hashable description of how the blob is parsed
+            parse: Callable turning the downloaded buffer into a DataFrame
+            use_cache: Reuse the cached DataFrame if the blob is unchanged
+            
+        Returns:
+            pandas.DataFrame: The parsed blob
+        """
+        blob_service_client = self._get_blob_service_client()
+        blob_client = blob_service_client.get_blob_client(
+            container=self.container_name, 
+            blob=blob_name
+        )
+        
+        cache_key = self._cache_key(blob_name)
+        with _dataframe_cache_lock:
+            cached = _dataframe_cache.get(cache_key) if use_cache else None
+        
+        # Download blob data, conditionally if we already hold this variant
+        conditions = {}
+        if cached is not None and variant in cached["frames"]:
+            conditions = {
+                "etag": cached["etag"],
+                "match_condition": MatchConditions.IfModified,
+            }
+        try:
+            content, properties = self._fetch_blob_content(blob_name, blob_client, **conditions)
+        except ResourceNotModifiedError:
+            return cached["frames"][variant]
+        
+        df = parse(content)
+        
+        if use_cache:
+            store_cached_dataframe(cache_key, variant, df, properties, content)
+        
+        return df
+    
+    def refresh_csv_dataframe(self, blob_name: str) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """
+        Refresh a cached CSV blob, fetching only the rows appended since the last load.
+        
+        For append-only files the cached copy remembers its byte length and last
+        bytes. When the blob has grown, only the new tail (plus those last bytes,
+        to confirm the existing content is unchanged) is downloaded and parsed,
+        and the rows are appended to the cached frame. Anything else (blob not
+        cached yet, rewritten, truncated, or last row unterminated) falls back
+        to a full download.
+        
+        Args:
+            blob_name: Name of the CSV blob
+            
+        Returns:
+            tuple: (full DataFrame, appended rows); appended rows are empty if the
+            blob is unchanged and None if it had to be loaded in full
+            
+        Raises:
+            Exception: If there's an error downloading or parsing the blob
+        """
+        variant = CSV_VARIANT
+        cache_key = self._cache_key(blob_name)
+        with _dataframe_cache_lock:
+            cached = _dataframe_cache.get(cache_key)
+        if cached is None or variant not in cached["frames"]:
+            return self.download_csv_as_dataframe(blob_name), None
+        
+        try:
+            blob_service_client = self._get_blob_service_client()
+            blob_client = blob_service_client.get_blob_client(
+                container=self.container_name, 
+                blob=blob_name
+            )
+            
+            old_df = cached["frames"][variant]
+            try:
+                properties = blob_client.get_blob_properties(
+                    etag=cached["etag"],
+                    match_condition=MatchConditions.IfModified
                 )
-            else:
-                # Use default Azure credential (Managed Identity in Azure App Service)
-                account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
-                self._blob_service_client = BlobServiceClient(
-                    account_url, 
-                    credential=DefaultAzureCredential()
+            except ResourceNotModifiedError:
+                return old_df, old_df.iloc[0:0]
+            
+            tail = cached["tail"]
+            if properties.size <= cached["size"] or not tail.endswith(b"\n"):
+                return self.download_csv_as_dataframe(blob_name), None
+            
+            start = cached["size"] - len(tail)
+            content = blob_client.download_blob(
+                offset=start,
+                length=properties.size - start,
+                etag=properties.etag,
+                match_condition=MatchConditions.IfNotModified
+            ).readall()
+            if content[:len(tail)] != tail:
+                # Existing content changed, so this was not a pure append
+                return self.download_csv_as_dataframe(blob_name), None
+            
+            new_rows = pd.read_csv(
+                io.BytesIO(content[len(tail):]),
+                header=None,
+                names=list(old_df.columns)
+            )
+            new_rows.index = pd.RangeIndex(len(old_df), len(old_df) + len(new_rows))
+            df = pd.concat([old_df, new_rows])
+            
+            with _dataframe_cache_lock:
+                _dataframe_cache[cache_key] = {
+                    "etag": properties.etag,
+                    "last_modified": properties.last_modified,
+                    "size": properties.size,
+                    "tail": content[-APPEND_CHECK_BYTES:],
+                    "frames": {variant: df},
+                }
+            
+            # Keep the disk copy and the status cache in step with the grown
+            # blob; the disk copy is only extended if it holds the old version
+            if self.disk_cache is not None:
+                old_content = self.disk_cache.get(
+                    self.storage_account_name, self.container_name, blob_name, cached["etag"]
                 )
-        return self._blob_service_client
+                if old_content is not None and len(old_content) == cached["size"]:
+                    self.disk_cache.put(
+                        self.storage_account_name, self.container_name, blob_name,
+                        properties.etag, old_content + content[len(tail):]
+                    )
+            self._set_cached_status(blob_name, True, properties)
+            
+            return df, new_rows
+            
+        except Exception as e:
+            raise Exception(f"Error loading data from blob storage: {str(e)}")
     
-    def download_csv_as_dataframe(self, blob_name: str) -> pd.DataFrame:
+    def download_csv_as_dataframe(self, blob_name: str, use_cache: bool = True) -> pd.DataFrame:
         """
         Download a CSV blob and return it as a pandas DataFrame.
         
+        When ``use_cache`` is set, the parsed DataFrame is kept together with the
+        blob's ETag. Subsequent calls send an If-None-Match request and only
+        re-download and re-parse when the blob has changed. The cached DataFrame
+        is shared between callers and must not be modified in place.
+        
         Args:
             blob_name: Name of the blob file to download
+            use_cache: Reuse the cached DataFrame if the blob is unchanged
             
         Returns:
             pandas.DataFrame: The CSV data as a DataFrame
@@ -55,54 +616,311 @@ class BlobStorageManager:
             Exception: If there's an error downloading or parsing the blob
         """
         try:
+            return self._load_dataframe_cached(
+                blob_name,
+                CSV_VARIANT,
+                parse_csv_content,
+                use_cache=use_cache
+            )
+        except Exception as e:
+            raise Exception(f"Error loading data from blob storage: {str(e)}")
+    
+    def download_parquet_as_dataframe(self, blob_name: str, columns: Optional[List[str]] = None,
+                                      use_cache: bool = True) -> pd.DataFrame:
+        """
+        Download a Parquet blob and return it as a pandas DataFrame.
+        
+        Args:
+            blob_name: Name of the Parquet blob to download
+            columns: Only decode these columns; None reads all columns
+            use_cache: Reuse the cached DataFrame if the blob is unchanged
+            
+        Returns:
+            pandas.DataFrame: The Parquet data as a DataFrame
+            
+        Raises:
+            Exception: If there's an error downloading or parsing the blob
+        """
+        try:
+            projection = tuple(columns) if columns is not None else None
+            return self._load_dataframe_cached(
+                blob_name,
+                ("parquet", projection),
+                lambda content: pd.read_parquet(_BufferReader(content), columns=columns),
+                use_cache=use_cache
+            )
+        except Exception as e:
+            raise Exception(f"Error loading data from blob storage: {str(e)}")
+    
+    def load_dataframe(self, blob_name: str, columns: Optional[List[str]] = None,
+                       use_cache: bool = True) -> pd.DataFrame:
+        """
+        Load a blob as a DataFrame, choosing the reader from its extension.
+        
+        ``.parquet``/``.pq`` blobs are read with column projection; anything else
+        is parsed as CSV and then narrowed to ``columns``.
+        
+        Args:
+            blob_name: Name of the blob file to download
+            columns: Only return these columns; None returns all columns
+            use_cache: Reuse the cached DataFrame if the blob is unchanged
+            
+        Returns:
+            pandas.DataFrame: The blob data as a DataFrame
+            
+        Raises:
+            Exception: If there's an error downloading or parsing the blob
+        """
+        if blob_name.lower().endswith(PARQUET_EXTENSIONS):
+            return self.download_parquet_as_dataframe(blob_name, columns=columns, use_cache=use_cache)
+        
+        df = self.download_csv_as_dataframe(blob_name, use_cache=use_cache)
+        if columns is not None:
+            df = df[columns]
+        return df
+    
+    def upload_dataframe_as_parquet(self, df: pd.DataFrame, blob_name: str,
+                                    overwrite: bool = True) -> None:
+        """
+        Upload a DataFrame to the container as a Parquet blob.
+        
+        Args:
+            df: DataFrame to upload
+            blob_name: Name of the Parquet blob to write
+            overwrite: Replace the blob if it already exists
+            
+        Raises:
+            Exception: If there's an error serialising or uploading the data
+        """
+        try:
+            buffer = io.BytesIO()
+            df.to_parquet(buffer, index=False)
+            
             blob_service_client = self._get_blob_service_client()
             blob_client = blob_service_client.get_blob_client(
                 container=self.container_name, 
                 blob=blob_name
             )
+            buffer.seek(0)
+            blob_client.upload_blob(buffer, overwrite=overwrite)
+            self.invalidate_cache(blob_name)
             
-            # Download blob data
-            blob_data = blob_client.download_blob()
-            csv_content = blob_data.readall()
+        except Exception as e:
+            raise Exception(f"Error uploading data to blob storage: {str(e)}")
+
+    def upload_dataframe(self, df: pd.DataFrame, blob_name: str, overwrite: bool = True) -> None:
+        """
+        Upload a DataFrame, choosing the format from the blob's extension.
+
+        ``.parquet``/``.pq`` blobs are written as Parquet; anything else as CSV.
+
+        Args:
+            df: DataFrame to upload
+            blob_name: Name of the blob to write
+            overwrite: Replace the blob if it already exists
+
+        Raises:
+            Exception: If there's an error serialising or uploading the data
+        """
+        if blob_name.lower().endswith(PARQUET_EXTENSIONS):
+            self.upload_dataframe_as_parquet(df, blob_name, overwrite=overwrite)
+            return
+
+        try:
+            blob_service_client = self._get_blob_service_client()
+            blob_client = blob_service_client.get_blob_client(
+                container=self.container_name,
+                blob=blob_name
+            )
+            blob_client.upload_blob(df.to_csv(index=False).encode("utf-8"), overwrite=overwrite)
+            self.invalidate_cache(blob_name)
+
+        except Exception as e:
+            raise Exception(f"Error uploading data to blob storage: {str(e)}")
+
+    def convert_csv_to_parquet(self, blob_name: str, parquet_blob_name: Optional[str] = None) -> str:
+        """
+        Publish a Parquet sibling of an existing CSV blob.
+        
+        Args:
+            blob_name: Name of the source CSV blob
+            parquet_blob_name: Name of the Parquet blob; defaults to the CSV name
+                with its extension replaced by ``.parquet``
             
-            # Parse CSV content into DataFrame
-            df = pd.read_csv(io.BytesIO(csv_content))
+        Returns:
+            str: Name of the Parquet blob that was written
             
-            return df
+        Raises:
+            Exception: If there's an error reading, converting or uploading the data
+        """
+        if parquet_blob_name is None:
+            stem, ext = os.path.splitext(blob_name)
+            parquet_blob_name = (stem if ext.lower() == ".csv" else blob_name) + ".parquet"
+        
+        df = self.download_csv_as_dataframe(blob_name, use_cache=False)
+        self.upload_dataframe_as_parquet(df, parquet_blob_name)
+        return parquet_blob_name
+    
+    def stream_csv_as_dataframe(
+        self, blob_name: str, chunksize: Optional[int] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Parse a CSV blob while it is being downloaded.
+        
+        The blob's chunk iterator is fed straight into the CSV reader, so parsing
+        overlaps the transfer and the raw bytes are never held in memory as a
+        whole. With ``chunksize`` the rows are yielded in DataFrame batches so
+        callers can render the first rows before the download completes.
+        Streamed loads bypass the ETag cache.
+        
+        Args:
+            blob_name: Name of the blob file to download
+            chunksize: Number of rows per yielded DataFrame; None parses the whole blob
+            
+        Returns:
+            pandas.DataFrame, or an iterator of DataFrames when chunksize is set
             
+        Raises:
+            Exception: If there's an error downloading or parsing the blob
+        """
+        try:
+            blob_service_client = self._get_blob_service_client()
+            blob_client = blob_service_client.get_blob_client(
+                container=self.container_name, 
+                blob=blob_name
+            )
+            stream = io.BufferedReader(_ChunkStreamReader(blob_client.download_blob().chunks()))
+            
+            if chunksize is None:
+                return pd.read_csv(stream)
+            return self._iter_csv_chunks(stream, chunksize)
+            
+        except Exception as e:
+            raise Exception(f"Error loading data from blob storage: {str(e)}")
+    
+    @staticmethod
+    def _iter_csv_chunks(stream, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Yield DataFrame batches from a CSV stream, closing the reader when done."""
+        try:
+            with pd.read_csv(stream, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield chunk
         except Exception as e:
             raise Exception(f"Error loading data from blob storage: {str(e)}")
     
-    def list_blobs(self) -> list:
+    def list_blobs(self, prefix: Optional[str] = None, delimiter: Optional[str] = None) -> list:
         """
-        List all blobs in the container.
+        List blobs in the container.
         
+        Args:
+            prefix: Only list blobs whose names start with this prefix
+            delimiter: List one level of a virtual directory hierarchy; names of
+                sub-directories are returned with a trailing delimiter
+            
         Returns:
             list: List of blob names in the container
         """
+        try:
+            return list(self.iter_blobs(prefix=prefix, delimiter=delimiter))
+            
+        except Exception as e:
+            raise Exception(f"Error listing blobs: {str(e)}")
+    
+    def iter_blobs(self, prefix: Optional[str] = None, delimiter: Optional[str] = None) -> Iterator[str]:
+        """
+        Lazily iterate blob names, fetching listing pages as they are consumed.
+        
+        Args:
+            prefix: Only list blobs whose names start with this prefix
+            delimiter: List one level of a virtual directory hierarchy
+            
+        Yields:
+            str: Blob (or virtual directory) name
+        """
+        blob_service_client = self._get_blob_service_client()
+        container_client = blob_service_client.get_container_client(self.container_name)
+        
+        if delimiter:
+            items = container_client.walk_blobs(name_starts_with=prefix, delimiter=delimiter)
+        else:
+            items = container_client.list_blobs(name_starts_with=prefix)
+        for item in items:
+            yield item.name
+    
+    def list_blobs_page(self, prefix: Optional[str] = None, page_size: int = 100,
+                        continuation_token: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+        """
+        List a single page of blob names.
+        
+        Args:
+            prefix: Only list blobs whose names start with this prefix
+            page_size: Maximum number of names to return
+            continuation_token: Token returned by the previous page; None starts from the beginning
+            
+        Returns:
+            tuple: (blob names, token for the next page or None if this was the last page)
+        """
         try:
             blob_service_client = self._get_blob_service_client()
             container_client = blob_service_client.get_container_client(self.container_name)
             
-            blob_list = []
-            for blob in container_client.list_blobs():
-                blob_list.append(blob.name)
-            
-            return blob_list
+            pages = container_client.list_blobs(
+                name_starts_with=prefix,
+                results_per_page=page_size
+            ).by_page(continuation_token=continuation_token)
+            names = [blob.name for blob in next(pages, [])]
+            return names, pages.continuation_token
             
         except Exception as e:
             raise Exception(f"Error listing blobs: {str(e)}")
     
+    def build_blob_index(self, prefix: Optional[str] = None) -> "BlobIndex":
+        """
+        Build an in-memory index of the blobs under a prefix.
+        
+        Args:
+            prefix: Only index blobs whose names start with this prefix
+            
+        Returns:
+            BlobIndex: Populated index
+        """
+        index = BlobIndex(self, prefix)
+        index.refresh()
+        return index
+    
+    def _get_cached_status(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """Get a cached existence/metadata answer that is still within the TTL."""
+        with _blob_status_cache_lock:
+            status = _blob_status_cache.get(self._cache_key(blob_name))
+        if status is None or time.monotonic() - status["checked_at"] > self.status_cache_ttl:
+            return None
+        return status
+    
+    def _set_cached_status(self, blob_name: str, exists: bool, properties=None) -> None:
+        """Record whether a blob exists, with its listing properties if known."""
+        with _blob_status_cache_lock:
+            _blob_status_cache[self._cache_key(blob_name)] = {
+                "exists": exists,
+                "properties": properties,
+                "checked_at": time.monotonic(),
+            }
+    
     def check_blob_exists(self, blob_name: str) -> bool:
         """
         Check if a specific blob exists in the container.
         
+        Answers are cached for ``status_cache_ttl`` seconds.
+        
         Args:
             blob_name: Name of the blob to check
             
         Returns:
             bool: True if blob exists, False otherwise
         """
+        status = self._get_cached_status(blob_name)
+        if status is not None:
+            return status["exists"]
+        
         try:
             blob_service_client = self._get_blob_service_client()
             blob_client = blob_service_client.get_blob_client(
@@ -110,22 +928,237 @@ class BlobStorageManager:
                 blob=blob_name
             )
             
-            return blob_client.exists()
+            exists = blob_client.exists()
+            self._set_cached_status(blob_name, exists)
+            return exists
             
         except Exception:
             return False
+    
+    def check_blobs_exist(self, blob_names: List[str]) -> Dict[str, bool]:
+        """
+        Check several blobs, with one listing request per directory.
+        
+        Names not answered from the cache are grouped by their directory
+        (``/``-separated prefix). Each group of several names is resolved by
+        listing only that directory level, starting at the names' longest
+        common prefix; names without a shared prefix fall back to one
+        existence check each, so the whole container is never listed. The
+        listed properties (size, ETag, last-modified) are cached alongside
+        the answer.
+        
+        Args:
+            blob_names: Names of the blobs to check
+            
+        Returns:
+            dict: Blob name to True if the blob exists, False otherwise
+        """
+        result = {}
+        groups: Dict[str, List[str]] = {}
+        for name in blob_names:
+            status = self._get_cached_status(name)
+            if status is not None:
+                result[name] = status["exists"]
+            else:
+                directory = name.rpartition("/")[0]
+                groups.setdefault(directory, []).append(name)
+        
+        for names in groups.values():
+            prefix = os.path.commonprefix(names)
+            if len(names) == 1 or not prefix:
+                for name in names:
+                    result[name] = self.check_blob_exists(name)
+                continue
+            
+            try:
+                blob_service_client = self._get_blob_service_client()
+                container_client = blob_service_client.get_container_client(self.container_name)
+                
+                wanted = set(names)
+                found = {}
+                # The delimiter keeps the listing to this directory level
+                for blob in container_client.walk_blobs(name_starts_with=prefix, delimiter="/"):
+                    if blob.name in wanted:
+                        found[blob.name] = blob
+                
+                for name in names:
+                    self._set_cached_status(name, name in found, found.get(name))
+                    result[name] = name in found
+                
+            except Exception:
+                for name in names:
+                    result[name] = False
+        
+        return result
+    
+    def get_blob_status(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached listing metadata of a blob, refreshing it if stale.
+        
+        Args:
+            blob_name: Name of the blob
+            
+        Returns:
+            dict: ``size``, ``etag`` and ``last_modified`` of the blob, or None if it does not exist
+        """
+        status = self._get_cached_status(blob_name)
+        if status is None or (status["exists"] and status["properties"] is None):
+            # Existence checks of a single blob do not return its properties,
+            # so fetch them directly
+            try:
+                blob_service_client = self._get_blob_service_client()
+                blob_client = blob_service_client.get_blob_client(
+                    container=self.container_name,
+                    blob=blob_name
+                )
+                properties = blob_client.get_blob_properties()
+            except ResourceNotFoundError:
+                self._set_cached_status(blob_name, False)
+                return None
+            except Exception:
+                return None
+            self._set_cached_status(blob_name, True, properties)
+        elif not status["exists"]:
+            return None
+        else:
+            properties = status["properties"]
+        if properties is None:
+            return None
+        return {
+            "size": properties.size,
+            "etag": properties.etag,
+            "last_modified": properties.last_modified,
+        }
+
+
+class BlobIndex:
+    """In-memory index of blob name to size, ETag and last-modified for one prefix."""
+    
+    def __init__(self, blob_manager: BlobStorageManager, prefix: Optional[str] = None):
+        """
+        Initialize the BlobIndex.
+        
+        Args:
+            blob_manager: Manager of the container to index
+            prefix: Only index blobs whose names start with this prefix
+        """
+        self.blob_manager = blob_manager
+        self.prefix = prefix
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.last_modified = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+    
+    def refresh(self) -> List[str]:
+        """
+        Bring the index up to date with the container.
+        
+        The listing API cannot filter by last-modified, so every refresh
+        re-lists all blobs under the prefix. The listing is built into a new
+        mapping and swapped in at the end, so lookups keep answering from the
+        previous listing meanwhile. New or changed (different ETag) entries
+        are reported and seed the manager's existence cache; blobs that
+        disappeared are dropped. ``last_modified`` tracks the newest change
+        seen, for use with ``modified_since``.
+        
+        Returns:
+            list: Names of blobs added or changed since the previous refresh
+        """
+        blob_service_client = self.blob_manager._get_blob_service_client()
+        container_client = blob_service_client.get_container_client(self.blob_manager.container_name)
+        
+        # Concurrent refreshes would each diff against the same old listing
+        with self._refresh_lock:
+            with self._lock:
+                previous = self.entries
+            
+            entries = {}
+            changed = []
+            newest = self.last_modified
+            for blob in container_client.list_blobs(name_starts_with=self.prefix):
+                entries[blob.name] = {
+                    "size": blob.size,
+                    "etag": blob.etag,
+                    "last_modified": blob.last_modified,
+                }
+                old_entry = previous.get(blob.name)
+                if old_entry is None or old_entry["etag"] != blob.etag:
+                    self.blob_manager._set_cached_status(blob.name, True, blob)
+                    changed.append(blob.name)
+                if newest is None or blob.last_modified > newest:
+                    newest = blob.last_modified
+            
+            with self._lock:
+                self.entries = entries
+                self.last_modified = newest
+            
+            for name in set(previous) - set(entries):
+                self.blob_manager._set_cached_status(name, False)
+        
+        return changed
+    
+    def get(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """Get the indexed size/ETag/last-modified of a blob, or None if not indexed."""
+        with self._lock:
+            return self.entries.get(blob_name)
+    
+    def names(self, prefix: Optional[str] = None) -> List[str]:
+        """Get the sorted names in the index, optionally narrowed to a sub-prefix."""
+        with self._lock:
+            return sorted(name for name in self.entries if prefix is None or name.startswith(prefix))
+    
+    def page(self, page_size: int, page_index: int = 0, prefix: Optional[str] = None) -> List[str]:
+        """Get one page of sorted names from the index."""
+        start = page_size * page_index
+        return self.names(prefix)[start:start + page_size]
+    
+    def modified_since(self, timestamp) -> List[str]:
+        """Get names of blobs last modified after the given datetime."""
+        with self._lock:
+            return sorted(
+                name for name, entry in self.entries.items()
+                if entry["last_modified"] > timestamp
+            )
 
 
 # Factory function for easy instantiation
-def create_blob_manager(storage_account_name: str, container_name: str) -> BlobStorageManager:
+def create_blob_manager(storage_account_name: str, container_name: str,
+                        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        disk_cache_dir: Optional[str] = None,
+                        disk_cache_max_bytes: int = 0,
+                        status_cache_ttl: float = DEFAULT_STATUS_CACHE_TTL,
+                        transport_options: Optional[Dict[str, Any]] = None) -> BlobStorageManager:
     """
     Factory function to create a BlobStorageManager instance.
     
     Args:
         storage_account_name: Name of the Azure Storage Account
         container_name: Name of the blob container
+        max_concurrency: Number of threads used for ranged downloads
+        chunk_size: Size in bytes of each downloaded range
+        disk_cache_dir: Directory for the persistent blob cache; None disables it
+        disk_cache_max_bytes: Size limit of the persistent blob cache
+        status_cache_ttl: Seconds an existence/metadata answer is reused
+        transport_options: Connection pool/timeout/retry overrides for the shared client
         
     Returns:
         BlobStorageManager: Configured blob storage manager instance
     """
-    return BlobStorageManager(storage_account_name, container_name)
+    disk_cache = None
+    if disk_cache_dir and disk_cache_max_bytes > 0:
+        try:
+            disk_cache = BlobDiskCache(disk_cache_dir, disk_cache_max_bytes)
+        except OSError:
+            # An unusable cache directory only disables the disk cache
+            disk_cache = None
+    
+    return BlobStorageManager(
+        storage_account_name,
+        container_name,
+        max_concurrency=max_concurrency,
+        chunk_size=chunk_size,
+        disk_cache=disk_cache,
+        status_cache_ttl=status_cache_ttl,
+        transport_options=transport_options
+    )
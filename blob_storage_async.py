@@ -0,0 +1,244 @@
+"""
+Asyncio-based Azure Blob Storage utilities for loading several blobs at once.
+
+Synchronous callers go through ``load_csv_blobs``, which runs the downloads
+on a process-wide event loop thread with one long-lived manager (and so one
+connection pool) per account and container. Parsed frames share the ETag
+cache of blob_storage, so unchanged blobs are answered with a conditional
+request.
+"""
+import asyncio
+import os
+import threading
+from typing import Dict, List, Optional
+
+import pandas as pd
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotModifiedError
+from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob.aio import BlobServiceClient
+from blob_storage import CSV_VARIANT, get_cached_dataframe, parse_csv_content, store_cached_dataframe
+
+# Event loop thread running every shared manager's requests; aio clients are
+# bound to the loop they first ran on, so they must all use the same one
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# One AsyncBlobStorageManager per (account, container), kept for the process lifetime
+_shared_managers: Dict[tuple, "AsyncBlobStorageManager"] = {}
+
+
+class AsyncBlobStorageManager:
+    """Async counterpart of BlobStorageManager built on the aio storage SDK.
+
+    One BlobServiceClient (and therefore one HTTP connection pool) is shared by
+    every call made through the manager. Use it as an async context manager, or
+    call ``close()`` when done; get_shared_async_manager returns a manager that
+    stays open for the process lifetime.
+    """
+
+    def __init__(self, storage_account_name: str, container_name: str):
+        """
+        Initialize the AsyncBlobStorageManager.
+
+        Args:
+            storage_account_name: Name of the Azure Storage Account
+            container_name: Name of the blob container
+        """
+        self.storage_account_name = storage_account_name
+        self.container_name = container_name
+        self.connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+        self._blob_service_client = None
+        self._credential = None
+
+    def _get_blob_service_client(self) -> BlobServiceClient:
+        """Get the async blob service client with appropriate authentication."""
+        if self._blob_service_client is None:
+            if self.connection_string:
+                # Use connection string if available (local dev or explicit config)
+                self._blob_service_client = BlobServiceClient.from_connection_string(
+                    self.connection_string
+                )
+            else:
+                # Use default Azure credential (Managed Identity in Azure App Service)
+                account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
+                self._credential = DefaultAzureCredential()
+                self._blob_service_client = BlobServiceClient(
+                    account_url,
+                    credential=self._credential
+                )
+        return self._blob_service_client
+
+    async def close(self) -> None:
+        """Close the underlying client and its connection pool."""
+        if self._blob_service_client is not None:
+            await self._blob_service_client.close()
+            self._blob_service_client = None
+        if self._credential is not None:
+            await self._credential.close()
+            self._credential = None
+
+    async def __aenter__(self) -> "AsyncBlobStorageManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def download_csv_as_dataframe(self, blob_name: str, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Download a CSV blob and return it as a pandas DataFrame.
+
+        With ``use_cache`` the frame is shared with BlobStorageManager's ETag
+        cache: a cached blob is only downloaded again if it has changed.
+        CSV parsing runs in a worker thread so other downloads keep progressing.
+
+        Args:
+            blob_name: Name of the blob file to download
+            use_cache: Reuse the cached DataFrame if the blob is unchanged
+
+        Returns:
+            pandas.DataFrame: The CSV data as a DataFrame
+
+        Raises:
+            Exception: If there's an error downloading or parsing the blob
+        """
+        try:
+            blob_client = self._get_blob_service_client().get_blob_client(
+                container=self.container_name,
+                blob=blob_name
+            )
+
+            cache_key = (self.storage_account_name, self.container_name, blob_name)
+            cached = get_cached_dataframe(cache_key, CSV_VARIANT) if use_cache else None
+            conditions = {}
+            if cached is not None:
+                conditions = {
+                    "etag": cached["etag"],
+                    "match_condition": MatchConditions.IfModified,
+                }
+
+            # Download blob data, conditionally if we already hold a parsed copy
+            try:
+                blob_data = await blob_client.download_blob(**conditions)
+            except ResourceNotModifiedError:
+                return cached["df"]
+            csv_content = await blob_data.readall()
+
+            # Parse CSV content into DataFrame
+            df = await asyncio.to_thread(parse_csv_content, csv_content)
+            if use_cache:
+                store_cached_dataframe(cache_key, CSV_VARIANT, df, blob_data.properties, csv_content)
+            return df
+
+        except Exception as e:
+            raise Exception(f"Error loading data from blob storage: {str(e)}")
+
+    async def list_blobs(self) -> list:
+        """
+        List all blobs in the container.
+
+        Returns:
+            list: List of blob names in the container
+        """
+        try:
+            container_client = self._get_blob_service_client().get_container_client(self.container_name)
+            return [blob.name async for blob in container_client.list_blobs()]
+
+        except Exception as e:
+            raise Exception(f"Error listing blobs: {str(e)}")
+
+    async def check_blob_exists(self, blob_name: str) -> bool:
+        """
+        Check if a specific blob exists in the container.
+
+        Args:
+            blob_name: Name of the blob to check
+
+        Returns:
+            bool: True if blob exists, False otherwise
+        """
+        try:
+            blob_client = self._get_blob_service_client().get_blob_client(
+                container=self.container_name,
+                blob=blob_name
+            )
+            return await blob_client.exists()
+
+        except Exception:
+            return False
+
+    async def download_csvs_as_dataframes(self, blob_names: List[str],
+                                          use_cache: bool = True) -> Dict[str, pd.DataFrame]:
+        """
+        Download several CSV blobs concurrently.
+
+        Args:
+            blob_names: Names of the blobs to download
+            use_cache: Reuse cached DataFrames of unchanged blobs
+
+        Returns:
+            dict: Blob name to DataFrame
+
+        Raises:
+            Exception: If any blob fails to download or parse
+        """
+        frames = await asyncio.gather(
+            *(self.download_csv_as_dataframe(name, use_cache=use_cache) for name in blob_names)
+        )
+        return dict(zip(blob_names, frames))
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="blob-storage-async", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def get_shared_async_manager(storage_account_name: str, container_name: str) -> AsyncBlobStorageManager:
+    """
+    Get the process-wide AsyncBlobStorageManager for a container.
+
+    The manager is never closed, so its connections stay open across page
+    renders. Its coroutines must run on the loop returned by _get_event_loop.
+
+    Args:
+        storage_account_name: Name of the Azure Storage Account
+        container_name: Name of the blob container
+
+    Returns:
+        AsyncBlobStorageManager: Shared manager
+    """
+    key = (storage_account_name, container_name)
+    with _loop_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = AsyncBlobStorageManager(storage_account_name, container_name)
+            _shared_managers[key] = manager
+        return manager
+
+
+def load_csv_blobs(storage_account_name: str, container_name: str,
+                   blob_names: List[str], use_cache: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    Load several CSV blobs concurrently from synchronous code (e.g. a Streamlit page).
+
+    Args:
+        storage_account_name: Name of the Azure Storage Account
+        container_name: Name of the blob container
+        blob_names: Names of the blobs to download
+        use_cache: Reuse cached DataFrames of unchanged blobs
+
+    Returns:
+        dict: Blob name to DataFrame
+    """
+    manager = get_shared_async_manager(storage_account_name, container_name)
+    future = asyncio.run_coroutine_threadsafe(
+        manager.download_csvs_as_dataframes(blob_names, use_cache=use_cache),
+        _get_event_loop()
+    )
+    return future.result()
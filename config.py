@@ -2,6 +2,7 @@
 Configuration settings for the Streamlit app.
 """
 import os
+import tempfile
 from typing import Dict, Any
 from dotenv import load_dotenv
 
@@ -17,6 +18,24 @@ class AppConfig:
     CONTAINER_NAME = "data"
     BLOB_NAME = "sample_data.csv"
     
+    # Blob download tuning (override per App Service SKU via app settings)
+    DOWNLOAD_MAX_CONCURRENCY = int(os.getenv('BLOB_DOWNLOAD_MAX_CONCURRENCY', '4'))
+    DOWNLOAD_CHUNK_SIZE = int(os.getenv('BLOB_DOWNLOAD_CHUNK_SIZE', str(8 * 1024 * 1024)))
+    
+    # Persistent blob cache (set BLOB_CACHE_DIR to "" to disable)
+    DISK_CACHE_DIR = os.getenv('BLOB_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'blob_cache'))
+    DISK_CACHE_MAX_BYTES = int(os.getenv('BLOB_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))
+    
+    # Seconds blob existence checks are reused across reruns
+    STATUS_CACHE_TTL = float(os.getenv('BLOB_STATUS_CACHE_TTL', '30'))
+    
+    # Shared HTTP transport for the blob service client
+    TRANSPORT_POOL_SIZE = int(os.getenv('BLOB_TRANSPORT_POOL_SIZE', '16'))
+    TRANSPORT_CONNECTION_TIMEOUT = int(os.getenv('BLOB_TRANSPORT_CONNECTION_TIMEOUT', '20'))
+    TRANSPORT_READ_TIMEOUT = int(os.getenv('BLOB_TRANSPORT_READ_TIMEOUT', '60'))
+    TRANSPORT_RETRY_TOTAL = int(os.getenv('BLOB_TRANSPORT_RETRY_TOTAL', '3'))
+    TRANSPORT_MAX_SINGLE_GET_SIZE = int(os.getenv('BLOB_TRANSPORT_MAX_SINGLE_GET_SIZE', str(32 * 1024 * 1024)))
+    
     # App Settings
     APP_TITLE = "Employee Data Dashboard"
     APP_DESCRIPTION = "This Streamlit app loads and displays data from Azure Blob Storage."
@@ -24,15 +43,29 @@ class AppConfig:
     # Chart Settings
     DEFAULT_CHART_HEIGHT = 400
     DEFAULT_CHART_WIDTH = 600
+    MAX_CHART_POINTS = int(os.getenv('MAX_CHART_POINTS', '2000'))
+    MAX_CHART_CATEGORIES = int(os.getenv('MAX_CHART_CATEGORIES', '20'))
     
     @classmethod
-    def get_azure_storage_config(cls) -> Dict[str, str]:
+    def get_azure_storage_config(cls) -> Dict[str, Any]:
         """Get Azure Storage configuration."""
         return {
             "storage_account_name": cls.STORAGE_ACCOUNT_NAME,
             "container_name": cls.CONTAINER_NAME,
             "blob_name": cls.BLOB_NAME,
-            "connection_string": os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+            "connection_string": os.getenv('AZURE_STORAGE_CONNECTION_STRING'),
+            "download_max_concurrency": cls.DOWNLOAD_MAX_CONCURRENCY,
+            "download_chunk_size": cls.DOWNLOAD_CHUNK_SIZE,
+            "disk_cache_dir": cls.DISK_CACHE_DIR,
+            "disk_cache_max_bytes": cls.DISK_CACHE_MAX_BYTES,
+            "status_cache_ttl": cls.STATUS_CACHE_TTL,
+            "transport_options": {
+                "pool_size": cls.TRANSPORT_POOL_SIZE,
+                "connection_timeout": cls.TRANSPORT_CONNECTION_TIMEOUT,
+                "read_timeout": cls.TRANSPORT_READ_TIMEOUT,
+                "retry_total": cls.TRANSPORT_RETRY_TOTAL,
+                "max_single_get_size": cls.TRANSPORT_MAX_SINGLE_GET_SIZE
+            }
         }
     
     @classmethod
@@ -42,7 +75,9 @@ class AppConfig:
             "title": cls.APP_TITLE,
             "description": cls.APP_DESCRIPTION,
             "chart_height": cls.DEFAULT_CHART_HEIGHT,
-            "chart_width": cls.DEFAULT_CHART_WIDTH
+            "chart_width": cls.DEFAULT_CHART_WIDTH,
+            "max_chart_points": cls.MAX_CHART_POINTS,
+            "max_chart_categories": cls.MAX_CHART_CATEGORIES
         }
     
     @classmethod
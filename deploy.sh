@@ -17,7 +17,7 @@ rm -f app.zip
 
 # Check syntax before deployment
 echo "🔍 Checking syntax..."
-python -m py_compile app.py blob_storage.py config.py
+python -m py_compile app.py analytics.py blob_storage.py blob_disk_cache.py file_cache.py config.py
 if [ $? -ne 0 ]; then
     echo "❌ Syntax errors found! Please fix before deploying."
     exit 1
@@ -28,7 +28,10 @@ echo "✅ Syntax check passed!"
 echo "📦 Creating deployment package..."
 zip -r app.zip \
     app.py \
+    analytics.py \
     blob_storage.py \
+    blob_disk_cache.py \
+    file_cache.py \
     config.py \
     startup.sh \
     requirements.txt \
@@ -0,0 +1,99 @@
+"""
+File helpers shared by the on-disk caches (blob_disk_cache.py, llm_cache.py).
+
+Entries are written atomically (temporary file + rename), recency is tracked
+through file modification times, and every operation tolerates files that
+another process deletes concurrently.
+"""
+import os
+import tempfile
+import time
+from typing import Optional
+
+TEMP_FILE_SUFFIX = ".tmp"
+# Temporary files older than this are left over from interrupted writes
+STALE_TEMP_FILE_SECONDS = 3600
+
+
+def atomic_write(cache_dir: str, path: str, data: bytes) -> None:
+    """
+    Write a file so readers only ever see the complete content.
+
+    Args:
+        cache_dir: Directory of the cache (the temporary file is created there)
+        path: Final path of the file
+        data: File content
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=TEMP_FILE_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        remove_file(tmp_path)
+        raise
+
+
+def mark_used(path: str) -> None:
+    """Bump a file's modification time so eviction treats it as recently used."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def remove_file(path: str) -> None:
+    """Remove a cache file, ignoring files that are gone or cannot be removed."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def evict_lru(cache_dir: str, suffix: str, max_bytes: Optional[int] = None,
+              max_entries: Optional[int] = None) -> None:
+    """
+    Delete the least recently used cache files until the limits are met.
+
+    Temporary files left behind by interrupted writes count towards the size
+    and are deleted once they are older than STALE_TEMP_FILE_SECONDS.
+
+    Args:
+        cache_dir: Directory of the cache
+        suffix: File name suffix of the cache entries
+        max_bytes: Total size the entries may occupy; None for no size limit
+        max_entries: Number of entries kept; None for no count limit
+    """
+    entries = []
+    total = 0
+    stale_before = time.time() - STALE_TEMP_FILE_SECONDS
+    for entry in os.scandir(cache_dir):
+        is_temp = entry.name.endswith(TEMP_FILE_SUFFIX)
+        if not is_temp and not entry.name.endswith(suffix):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        if is_temp:
+            if stat.st_mtime < stale_before:
+                remove_file(entry.path)
+            else:
+                # Possibly still being written by another process
+                total += stat.st_size
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total += stat.st_size
+
+    count = len(entries)
+    for _, size, path in sorted(entries):
+        over_size = max_bytes is not None and total > max_bytes
+        over_count = max_entries is not None and count > max_entries
+        if not over_size and not over_count:
+            break
+        remove_file(path)
+        total -= size
+        count -= 1
@@ -0,0 +1,148 @@
+"""
+Pluggable model backends for the Streamlit LLM page (main.py).
+
+Every backend exposes the same two calls:
+
+- ``generate_content(prompt, generation_config=None)`` returning an object with
+  a ``text`` attribute (the Gemini SDK protocol), and
+- ``stream(prompt, generation_config=None)`` yielding the response text in
+  incremental chunks.
+
+``FakeBackend`` produces canned output locally, so streaming, caching and
+batch runs can be exercised offline.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+def count_tokens(text: str) -> int:
+    """Approximate the token count of a text by its whitespace-separated words."""
+    return len(text.split())
+
+
+class GeminiBackend:
+    """Backend wrapping a ``google.generativeai.GenerativeModel``.
+
+    The SDK is imported and the model created on the first generation, so
+    pages that never call the model do not pay for the import.
+    """
+
+    def __init__(self, model_name: str, api_key: str):
+        """
+        Initialize the GeminiBackend.
+
+        Args:
+            model_name: Gemini model name, e.g. ``gemini-pro``
+            api_key: Google API key
+        """
+        self.model_name = model_name
+        self.api_key = api_key
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The GenerativeModel, created on first access."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    import google.generativeai as genai
+
+                    genai.configure(api_key=self.api_key)
+                    self._model = genai.GenerativeModel(self.model_name)
+        return self._model
+
+    def generate_content(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None):
+        """Generate a complete response."""
+        return self.model.generate_content(prompt, generation_config=generation_config)
+
+    def stream(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the response text as the model produces it."""
+        for chunk in self.model.generate_content(prompt, generation_config=generation_config, stream=True):
+            if chunk.text:
+                yield chunk.text
+
+
+class _FakeResponse:
+    """Minimal stand-in for an SDK response object."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeBackend:
+    """Offline backend returning generated text in word-sized chunks."""
+
+    def __init__(self, respond: Optional[Callable[[str], str]] = None,
+                 words_per_chunk: int = 3, chunk_delay: float = 0.05):
+        """
+        Initialize the FakeBackend.
+
+        Args:
+            respond: Maps a prompt to the response text; defaults to echoing the prompt
+            words_per_chunk: Words emitted per streamed chunk
+            chunk_delay: Seconds to wait before each chunk, to mimic generation latency
+        """
+        self.respond = respond or (lambda prompt: f"Echo: {prompt}")
+        self.words_per_chunk = words_per_chunk
+        self.chunk_delay = chunk_delay
+
+    def generate_content(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> _FakeResponse:
+        """Generate a complete response."""
+        return _FakeResponse("".join(self.stream(prompt, generation_config)))
+
+    def stream(self, prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the response a few words at a time."""
+        words = self.respond(prompt).split(" ")
+        for start in range(0, len(words), self.words_per_chunk):
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+            chunk = " ".join(words[start:start + self.words_per_chunk])
+            yield chunk if start + self.words_per_chunk >= len(words) else chunk + " "
+
+
+class TimedStream:
+    """Iterable wrapper recording time-to-first-token and throughput of a chunk stream."""
+
+    def __init__(self, chunks: Iterable[str]):
+        """
+        Initialize the TimedStream.
+
+        Args:
+            chunks: Text chunks to pass through
+        """
+        self._chunks = chunks
+        self.started_at = None
+        self.first_chunk_at = None
+        self.finished_at = None
+        self.tokens = 0
+
+    def __iter__(self) -> Iterator[str]:
+        self.started_at = time.perf_counter()
+        for chunk in self._chunks:
+            if self.first_chunk_at is None:
+                self.first_chunk_at = time.perf_counter()
+            self.tokens += count_tokens(chunk)
+            yield chunk
+        self.finished_at = time.perf_counter()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get the timing of the consumed stream.
+
+        Returns:
+            dict: ``time_to_first_token`` and ``total_time`` in seconds,
+            approximate ``tokens`` and ``tokens_per_second``
+        """
+        end = self.finished_at or time.perf_counter()
+        total_time = end - self.started_at if self.started_at is not None else None
+        time_to_first_token = (
+            self.first_chunk_at - self.started_at if self.first_chunk_at is not None else None
+        )
+        return {
+            "time_to_first_token": time_to_first_token,
+            "total_time": total_time,
+            "tokens": self.tokens,
+            "tokens_per_second": self.tokens / total_time if total_time else None,
+        }
@@ -0,0 +1,195 @@
+"""
+Batch prompt runner for the Streamlit LLM page (main.py).
+
+Prompts are read from a CSV/JSONL upload or a blob, answered concurrently by
+a bounded thread pool under a client-side rate limit, retried with
+exponential backoff, and collected into a DataFrame that can be downloaded
+or written back to blob storage.
+"""
+import io
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from llm_cache import ResponseCache
+
+PROMPT_COLUMN = "prompt"
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+# HTTP statuses worth retrying (timeouts, rate limiting, server errors); the
+# Google API exceptions carry the status in ``code``
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls evenly to stay under a per-minute budget."""
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Initialize the RateLimiter.
+
+        Args:
+            requests_per_minute: Maximum call rate; 0 or less disables limiting
+        """
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may start its next request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def read_prompts(data: bytes, file_name: str) -> pd.DataFrame:
+    """
+    Parse an uploaded prompt file.
+
+    ``.jsonl`` files hold one JSON object per line; anything else is read as
+    CSV. Either way the result must contain a ``prompt`` column; extra columns
+    (ids, expected answers, ...) are carried through to the results.
+
+    Args:
+        data: Raw file content
+        file_name: Name of the file, used to pick the parser
+
+    Returns:
+        pandas.DataFrame: One row per prompt
+
+    Raises:
+        Exception: If the file cannot be parsed or has no prompt column
+    """
+    try:
+        if file_name.lower().endswith(".jsonl"):
+            records = [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+            df = pd.DataFrame.from_records(records)
+        else:
+            df = pd.read_csv(io.BytesIO(data))
+    except Exception as e:
+        raise Exception(f"Error reading prompt file: {str(e)}")
+
+    if PROMPT_COLUMN not in df.columns:
+        raise Exception(f"Error reading prompt file: no '{PROMPT_COLUMN}' column")
+    return df
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether a failed request may succeed when retried."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return getattr(error, "code", None) in TRANSIENT_STATUS_CODES
+
+
+def _generate_with_retry(backend, prompt: str, generation_params: Optional[Dict[str, Any]],
+                         limiter: RateLimiter, max_retries: int, backoff_seconds: float) -> Dict[str, Any]:
+    """
+    Ask the model one prompt, retrying transient failures with exponential backoff and jitter.
+
+    Other errors (bad key, invalid request, ...) fail the prompt immediately.
+
+    Returns:
+        dict: ``response``, ``cached``, ``error``, ``attempts`` and ``latency``
+    """
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        attempt += 1
+        limiter.acquire()
+        try:
+            response = backend.generate_content(prompt, generation_config=generation_params or None)
+            text = response.text
+        except Exception as e:
+            if attempt > max_retries or not _is_transient(e):
+                return {
+                    "response": None,
+                    "cached": False,
+                    "error": str(e),
+                    "attempts": attempt,
+                    "latency": time.perf_counter() - started,
+                }
+            delay = min(MAX_BACKOFF_SECONDS, backoff_seconds * 2 ** (attempt - 1))
+            time.sleep(delay * random.uniform(0.5, 1.0))
+            continue
+
+        return {
+            "response": text,
+            "cached": False,
+            "error": None,
+            "attempts": attempt,
+            "latency": time.perf_counter() - started,
+        }
+
+
+def run_batch(prompts: pd.DataFrame, backend, model_name: str, cache: ResponseCache,
+              generation_params: Optional[Dict[str, Any]] = None,
+              max_workers: int = DEFAULT_MAX_WORKERS,
+              requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+              max_retries: int = DEFAULT_MAX_RETRIES,
+              backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+              on_progress: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
+    """
+    Answer every prompt of a batch concurrently.
+
+    At most ``max_workers`` requests are in flight and requests start no faster
+    than ``requests_per_minute``; prompts answered from the cache neither wait
+    for the rate limit nor use up its budget. Transient failures are retried;
+    failed and empty prompts are recorded with their error instead of aborting
+    the batch.
+
+    Args:
+        prompts: Frame with a ``prompt`` column, as returned by read_prompts
+        backend: Model backend (see llm_backends)
+        model_name: Name of the model, part of the cache key
+        cache: Response cache consulted before calling the model
+        generation_params: Generation settings applied to every prompt
+        max_workers: Number of concurrent requests
+        requests_per_minute: Client-side rate limit; 0 disables it
+        max_retries: Retries per prompt after a transient failure
+        backoff_seconds: Initial retry delay, doubled on every retry
+        on_progress: Called with (completed, total) after each prompt
+
+    Returns:
+        pandas.DataFrame: The input rows plus ``response``, ``cached``,
+        ``error``, ``attempts`` and ``latency`` columns, in input order
+    """
+    limiter = RateLimiter(requests_per_minute)
+    prompt_list = prompts[PROMPT_COLUMN].fillna("").astype(str).tolist()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(prompt_list)
+
+    def answer(prompt: str) -> Dict[str, Any]:
+        if not prompt.strip():
+            return {"response": None, "cached": False, "error": "Empty prompt", "attempts": 0, "latency": 0.0}
+        key = cache.make_key(model_name, prompt, generation_params)
+        text = cache.get(key)
+        if text is not None:
+            return {"response": text, "cached": True, "error": None, "attempts": 0, "latency": 0.0}
+        result = _generate_with_retry(
+            backend, prompt, generation_params, limiter, max_retries, backoff_seconds
+        )
+        if result["error"] is None:
+            cache.put(key, result["response"])
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(answer, prompt): i for i, prompt in enumerate(prompt_list)}
+        for completed, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if on_progress is not None:
+                on_progress(completed, len(prompt_list))
+
+    output = prompts.reset_index(drop=True).copy()
+    return pd.concat([output, pd.DataFrame.from_records(results, index=output.index)], axis=1)
@@ -0,0 +1,205 @@
+"""
+Disk-backed cache of LLM responses for the Streamlit LLM page (main.py).
+
+Responses are keyed on the model name, the normalised prompt and the
+generation parameters, so re-running the same (or a trivially reformatted)
+prompt returns the stored text instead of calling the model again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Iterator, Optional
+
+from file_cache import atomic_write, evict_lru, mark_used, remove_file
+
+DEFAULT_CACHE_DIR = os.getenv('LLM_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'llm_cache'))
+DEFAULT_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', str(24 * 3600)))
+DEFAULT_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '1000'))
+CACHE_FILE_SUFFIX = ".json"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalise a prompt so trivially different versions share a cache entry.
+
+    Unicode is NFC-normalised, line endings unified, and runs of whitespace
+    collapsed; case and punctuation are kept since they can change the answer.
+
+    Args:
+        prompt: Prompt as entered by the user
+
+    Returns:
+        str: Normalised prompt
+    """
+    prompt = unicodedata.normalize("NFC", prompt)
+    return " ".join(prompt.split())
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of model responses stored as JSON files."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the ResponseCache.
+
+        Args:
+            cache_dir: Directory holding the cached responses (created if missing)
+            ttl_seconds: Seconds after which a cached response is ignored
+            max_entries: Number of responses kept before least recently used ones are evicted
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str, generation_params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            model_name: Name of the model answering the prompt
+            prompt: Prompt text (normalised here)
+            generation_params: Generation settings such as temperature
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = json.dumps(
+            [model_name, normalize_prompt(prompt), generation_params or {}],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Get the file path of a cache entry."""
+        return os.path.join(self.cache_dir, key + CACHE_FILE_SUFFIX)
+
+    def _count(self, hit: bool) -> None:
+        """Update the hit/miss counters."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            str: Cached response text, or None if missing or expired
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            remove_file(path)
+            self._count(hit=False)
+            return None
+
+        mark_used(path)
+        self._count(hit=True)
+        return entry["text"]
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Store a response atomically and evict old entries over max_entries.
+
+        Write errors are ignored: the response is simply not cached.
+
+        Args:
+            key: Key from make_key
+            text: Response text
+        """
+        data = json.dumps({"created_at": time.time(), "text": text}).encode("utf-8")
+        try:
+            atomic_write(self.cache_dir, self._path(key), data)
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until at most max_entries remain."""
+        evict_lru(self.cache_dir, CACHE_FILE_SUFFIX, max_entries=self.max_entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit/miss counters."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def generate_cached(cache: ResponseCache, model, model_name: str, prompt: str,
+                    generation_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Answer a prompt from the cache, calling the model only on a miss.
+
+    Args:
+        cache: Response cache
+        model: Object with ``generate_content(prompt, generation_config=...)``
+            returning a response with a ``text`` attribute (a backend from
+            llm_backends, the Gemini SDK model, or a local stub)
+        model_name: Name of the model, part of the cache key
+        prompt: Prompt text
+        generation_params: Generation settings, part of the cache key
+
+    Returns:
+        dict: ``text`` of the response and ``cached`` (True when served from cache)
+    """
+    key = cache.make_key(model_name, prompt, generation_params)
+    text = cache.get(key)
+    if text is not None:
+        return {"text": text, "cached": True}
+
+    response = model.generate_content(prompt, generation_config=generation_params or None)
+    cache.put(key, response.text)
+    return {"text": response.text, "cached": False}
+
+
+def stream_cached(cache: ResponseCache, backend, model_name: str, prompt: str,
+                  generation_params: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    Stream a response, serving it from the cache when possible.
+
+    A cached response is yielded as a single chunk. Otherwise the backend's
+    chunks are passed through as they arrive and the full text is cached once
+    the stream has been consumed completely.
+
+    Args:
+        cache: Response cache
+        backend: Backend with a ``stream(prompt, generation_config=...)`` method
+        model_name: Name of the model, part of the cache key
+        prompt: Prompt text
+        generation_params: Generation settings, part of the cache key
+
+    Yields:
+        str: Response text chunks
+    """
+    key = cache.make_key(model_name, prompt, generation_params)
+    text = cache.get(key)
+    if text is not None:
+        yield text
+        return
+
+    parts = []
+    for chunk in backend.stream(prompt, generation_config=generation_params or None):
+        parts.append(chunk)
+        yield chunk
+    cache.put(key, "".join(parts))
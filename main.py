@@ -1,31 +1,180 @@
 import streamlit as st
-import google.generativeai as genai
 import os
+import pandas as pd
+from llm_backends import FakeBackend, GeminiBackend, TimedStream
+from llm_batch import read_prompts, run_batch
+from llm_cache import ResponseCache, generate_cached, stream_cached
 
-# Configure the Google Gemini API (get your key from Azure App Settings)
-GEMINI_API_KEY = os.environ.get("GOOGLE_API_KEY") # Or st.secrets["GOOGLE_API_KEY"] if using secrets.toml for local dev
+MODEL_NAME = 'gemini-pro' # Or 'gemini-1.5-flash' for faster, cheaper inference
+GENERATION_PARAMS = {}
 
-if not GEMINI_API_KEY:
-    st.error("Google API Key not found. Please set it as an environment variable or in .streamlit/secrets.toml")
-else:
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel('gemini-pro') # Or 'gemini-1.5-flash' for faster, cheaper inference
+# "gemini" calls the Google API; "fake" answers locally for offline testing
+LLM_BACKEND = os.environ.get("LLM_BACKEND", "gemini")
 
-    st.title('Streamlit LLM Experimentation')
+# Batch mode: concurrent requests and client-side rate limit (match the provider quota)
+BATCH_MAX_WORKERS = int(os.environ.get("LLM_BATCH_MAX_WORKERS", "4"))
+BATCH_REQUESTS_PER_MINUTE = float(os.environ.get("LLM_BATCH_REQUESTS_PER_MINUTE", "60"))
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide response cache shared by all sessions."""
+    return ResponseCache()
+
+@st.cache_resource
+def get_blob_manager():
+    """Blob storage manager for batch input/output, created on first use."""
+    from blob_storage import create_blob_manager
+    from config import AppConfig
+
+    config = AppConfig.get_azure_storage_config()
+    return create_blob_manager(
+        config["storage_account_name"],
+        config["container_name"],
+        max_concurrency=config["download_max_concurrency"],
+        chunk_size=config["download_chunk_size"],
+        disk_cache_dir=config["disk_cache_dir"],
+        disk_cache_max_bytes=config["disk_cache_max_bytes"],
+        status_cache_ttl=config["status_cache_ttl"],
+        transport_options=config["transport_options"]
+    )
+
+def load_prompt_blobs(blob_names):
+    """Load and concatenate prompt blobs, downloading several CSVs concurrently."""
+    blob_manager = get_blob_manager()
+    frames = {}
+    csv_names = [name for name in blob_names if name.lower().endswith(".csv")]
+    if len(csv_names) > 1:
+        from blob_storage_async import load_csv_blobs
+        frames.update(load_csv_blobs(blob_manager.storage_account_name, blob_manager.container_name, csv_names))
+    for name in blob_names:
+        if name not in frames:
+            frames[name] = blob_manager.load_dataframe(name)
+    return pd.concat([frames[name] for name in blob_names], ignore_index=True)
+
+def render_batch_mode(backend, response_cache):
+    """Run a file or blob of prompts through the model and offer the results."""
+    source = st.radio("Prompt source", ["Upload file", "Blob storage"], horizontal=True)
+    prompts = None
+    try:
+        if source == "Upload file":
+            uploaded = st.file_uploader("Prompt file (CSV or JSONL with a 'prompt' column)", type=["csv", "jsonl"])
+            if uploaded is not None:
+                prompts = read_prompts(uploaded.getvalue(), uploaded.name)
+        else:
+            blob_input = st.text_input("Prompt blobs (comma-separated CSV or Parquet names with a 'prompt' column)")
+            blob_names = [name.strip() for name in blob_input.split(",") if name.strip()]
+            if blob_names:
+                prompts = load_prompt_blobs(blob_names)
+                if "prompt" not in prompts.columns:
+                    st.error("The blobs have no 'prompt' column.")
+                    prompts = None
+    except Exception as e:
+        st.error(f"An error occurred: {e}")
+
+    if prompts is None:
+        return
+
+    st.write(f"{len(prompts)} prompts loaded.")
+    if st.button("Run Batch"):
+        progress = st.progress(0.0, text="Running prompts...")
+        results = run_batch(
+            prompts,
+            backend,
+            MODEL_NAME,
+            response_cache,
+            generation_params=GENERATION_PARAMS,
+            max_workers=BATCH_MAX_WORKERS,
+            requests_per_minute=BATCH_REQUESTS_PER_MINUTE,
+            on_progress=lambda done, total: progress.progress(done / total, text=f"{done}/{total} prompts")
+        )
+        st.session_state.batch_results = results
+
+    results = st.session_state.get("batch_results")
+    if results is None:
+        return
 
+    failed = int(results["error"].notna().sum())
+    st.write(f"{len(results) - failed} succeeded, {failed} failed, {int(results['cached'].sum())} from cache.")
+    st.dataframe(results, use_container_width=True)
+    st.download_button(
+        label="Download results as CSV",
+        data=results.to_csv(index=False),
+        file_name="batch_results.csv",
+        mime="text/csv"
+    )
+
+    output_blob = st.text_input("Write results to blob (.csv or .parquet)")
+    if output_blob and st.button("Save to Blob Storage"):
+        try:
+            get_blob_manager().upload_dataframe(results, output_blob)
+            st.success(f"Results written to {output_blob}")
+        except Exception as e:
+            st.error(f"An error occurred: {e}")
+
+def render_single_prompt(backend, response_cache):
+    """Answer one prompt, streamed or in one piece."""
     user_input = st.text_area("Enter your prompt:")
+    stream_response = st.toggle("Stream response", value=True)
 
     if st.button("Generate Response"):
         if user_input:
             try:
-                with st.spinner("Generating..."):
-                    # For chat-like interactions, use start_chat()
-                    # For single turn prompts, use generate_content()
-                    response = model.generate_content(user_input)
+                if stream_response:
+                    # Render chunks as they arrive instead of waiting for the full text
                     st.write("---")
                     st.write("### LLM Response:")
-                    st.write(response.text)
+                    timed_stream = TimedStream(
+                        stream_cached(response_cache, backend, MODEL_NAME, user_input, GENERATION_PARAMS)
+                    )
+                    st.write_stream(timed_stream)
+                    timing = timed_stream.stats()
+                    if timing["time_to_first_token"] is not None:
+                        st.caption(
+                            f"Time to first token: {timing['time_to_first_token']:.2f}s · "
+                            f"Total: {timing['total_time']:.2f}s · "
+                            f"~{timing['tokens_per_second'] or 0:.1f} tokens/s"
+                        )
+                else:
+                    with st.spinner("Generating..."):
+                        # For chat-like interactions, use start_chat()
+                        # For single turn prompts, use generate_content()
+                        result = generate_cached(response_cache, backend, MODEL_NAME, user_input, GENERATION_PARAMS)
+                        st.write("---")
+                        st.write("### LLM Response:")
+                        st.write(result["text"])
+                        if result["cached"]:
+                            st.caption("Served from response cache")
             except Exception as e:
                 st.error(f"An error occurred: {e}")
         else:
-            st.warning("Please enter a prompt.")
\ No newline at end of file
+            st.warning("Please enter a prompt.")
+
+@st.cache_resource
+def get_backend(backend_name, model_name, api_key):
+    """Model backend shared by all sessions, one per backend/model/key.
+
+    The Gemini SDK itself is only imported on the first generation.
+    """
+    if backend_name == "fake":
+        return FakeBackend()
+    return GeminiBackend(model_name, api_key)
+
+# Configure the Google Gemini API (get your key from Azure App Settings)
+GEMINI_API_KEY = os.environ.get("GOOGLE_API_KEY") # Or st.secrets["GOOGLE_API_KEY"] if using secrets.toml for local dev
+
+if not GEMINI_API_KEY and LLM_BACKEND != "fake":
+    st.error("Google API Key not found. Please set it as an environment variable or in .streamlit/secrets.toml")
+else:
+    backend = get_backend(LLM_BACKEND, MODEL_NAME, GEMINI_API_KEY)
+    response_cache = get_response_cache()
+
+    st.title('Streamlit LLM Experimentation')
+
+    mode = st.radio("Mode", ["Single prompt", "Batch"], horizontal=True)
+    if mode == "Batch":
+        render_batch_mode(backend, response_cache)
+    else:
+        render_single_prompt(backend, response_cache)
+
+    cache_stats = response_cache.stats()
+    st.caption(f"Response cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses")
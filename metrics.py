@@ -1,10 +1,27 @@
 """
 Common helper functions for metrics pages (OPAS, SAAS, etc.)
 """
+import threading
+from collections import OrderedDict
+
 import streamlit as st
 import pandas as pd
+from urllib.parse import quote
 from utils.assmnt_plan import constants
-from utils.assmnt_plan.utils_assmnt import get_metrics_df, read_metrics_file
+from utils.assmnt_plan.utils_assmnt import get_metrics_df
+from shared_cache import frame_store
+from metrics_index import (
+    append_metrics_rows,
+    get_column_options,
+    get_filter_index,
+    get_sort_rank,
+    get_summary_cube,
+    invalidate_frame_artifacts,
+    get_frame_artifact,
+    normalize_metrics_frame,
+    page_row_positions,
+    share_frame_artifacts,
+)
 
 
 # Constants
@@ -20,6 +37,20 @@ MAX_DISPLAYED_ROWS = 10
 COLUMN_WIDTHS = [3, 1, 1, 1]  # For file display columns
 DECIMAL_PLACES = 1
 
+# Query parameter carrying the clinician in feedback links
+CLINICIAN_QUERY_PARAM = "clinician_name"
+
+# Clinician-specific link frames kept per base frame (least recently used dropped)
+MAX_CLINICIAN_LINK_FRAMES = 8
+_clinician_links_lock = threading.Lock()
+
+# Rows per page in render_metrics_table_paged, and their sort order
+DEFAULT_PAGE_SIZE = 50
+SORT_COLUMNS = ("TenantId", "AssessmentId")
+
+# Column configurations keyed by (labels, percent columns)
+_column_config_cache = {}
+
 
 def get_common_labels():
     """Get common column labels for metrics display."""
@@ -113,12 +144,9 @@ def select_clinician():
         # Store the new selection
         st.session_state.clinician_name = selection
         
-        # Instead of clearing cache and rerunning, 
-        # mark that data needs to be reloaded for this user
-        if "metrics_data" in st.session_state:
-            del st.session_state.metrics_data
-        
-        # Also clear any derived data that depends on clinician selection
+        # The shared base frame stays loaded; only the feedback links depend on
+        # the clinician and they are derived per selection in add_clinician_links.
+        # Clear any derived data that depends on clinician selection
         if "filtered_metrics" in st.session_state:
             del st.session_state.filtered_metrics
     
@@ -149,27 +177,47 @@ def create_filters(df, use_hospital_filter=True):
     
     with col2:
         # Filter by note type
-        note_type_list = sorted(df["Note_Type"].unique().tolist())
+        note_type_list = get_column_options(df, "Note_Type")
         note_type_list = [ALL_TYPES] + note_type_list
         selected_note_type = st.selectbox("Filter by Note Type", note_type_list)
     
     with col3:
         if use_hospital_filter:
             # Filter by hospital
-            hospitals_list = sorted(df["Notes"].dropna().unique().astype(str).tolist())
+            hospitals_list = get_column_options(df, "Notes")
             # Remove 'null' values if they exist
             hospitals_list = [h for h in hospitals_list if h.lower() != 'null']
             hospitals = [ALL_HOSPITALS] + hospitals_list
             selected_third_filter = st.selectbox("Filter by Hospital", hospitals)
         else:
             # Filter by tenant
-            tenants_list = sorted(df["TenantId"].unique().astype(str).tolist())
+            tenants_list = get_column_options(df, "TenantId")
             tenants = [ALL_TENANTS] + tenants_list
             selected_third_filter = st.selectbox("Filter by Tenant", tenants)
     
     return selected_accuracy, selected_note_type, selected_third_filter
 
 
+def build_filter_selections(selected_accuracy, selected_note_type, selected_third_filter, use_hospital_filter=True):
+    """Map the selected filter values to {column: value}, leaving out "All ..." choices."""
+    selections = {}
+    
+    if selected_accuracy != ALL_LEVELS:
+        selections["Accuracy"] = selected_accuracy
+    
+    if selected_note_type != ALL_TYPES:
+        selections["Note_Type"] = selected_note_type
+    
+    if use_hospital_filter:
+        if selected_third_filter != ALL_HOSPITALS:
+            selections["Notes"] = selected_third_filter
+    else:
+        if selected_third_filter != ALL_TENANTS:
+            selections["TenantId"] = selected_third_filter
+    
+    return selections
+
+
 def apply_filters(df, selected_accuracy, selected_note_type, selected_third_filter, use_hospital_filter=True):
     """Apply filters to the dataframe.
     
@@ -180,23 +228,38 @@ def apply_filters(df, selected_accuracy, selected_note_type, selected_third_filt
         selected_third_filter: Selected hospital or tenant (depending on use_hospital_filter)
         use_hospital_filter: If True, filter by hospital (Notes column), 
                            if False, filter by tenant (TenantId column)
-    """
-    filtered_df = df.copy()
     
-    if selected_accuracy != ALL_LEVELS:
-        filtered_df = filtered_df[filtered_df["Accuracy"] == selected_accuracy]
+    Returns:
+        The matching rows; the (shared) input frame itself when no filter is set,
+        so callers must not modify the result in place.
+    """
+    selections = build_filter_selections(
+        selected_accuracy, selected_note_type, selected_third_filter, use_hospital_filter
+    )
     
-    if selected_note_type != ALL_TYPES and "Note_Type" in df.columns:
-        filtered_df = filtered_df[filtered_df["Note_Type"] == selected_note_type]
+    # The index is built once per loaded frame, so a filter change only
+    # intersects precomputed row positions and takes the matching rows
+    return get_filter_index(df).filter(df, selections)
+
+
+def summarize_metrics(df, selected_accuracy, selected_note_type, selected_third_filter, use_hospital_filter=True):
+    """Get summary statistics for a filter selection from the precomputed cube.
     
-    if use_hospital_filter:
-        if selected_third_filter != ALL_HOSPITALS and "Notes" in df.columns:
-            filtered_df = filtered_df[filtered_df["Notes"].astype(str) == selected_third_filter]
-    else:
-        if selected_third_filter != ALL_TENANTS and "TenantId" in df.columns:
-            filtered_df = filtered_df[filtered_df["TenantId"].astype(str) == selected_third_filter]
+    Args:
+        df: Unfiltered (loaded) metrics DataFrame
+        selected_accuracy: Selected accuracy level
+        selected_note_type: Selected note type
+        selected_third_filter: Selected hospital or tenant (depending on use_hospital_filter)
+        use_hospital_filter: If True, filter by hospital (Notes column), 
+                           if False, filter by tenant (TenantId column)
     
-    return filtered_df
+    Returns:
+        dict: Summary statistics to pass to render_metrics_summary
+    """
+    selections = build_filter_selections(
+        selected_accuracy, selected_note_type, selected_third_filter, use_hospital_filter
+    )
+    return get_summary_cube(df).summarize(selections)
 
 
 def get_display_columns():
@@ -208,11 +271,8 @@ def get_display_columns():
     return display_columns
 
 
-def create_column_config(labels, percent_columns=None):
-    """Create column configuration for dataframe display."""
-    if percent_columns is None:
-        percent_columns = constants.MetricsColumns.PERCENT_COLUMNS
-    
+def _build_column_config(labels, percent_columns):
+    """Build the st.column_config mapping for the given labels."""
     column_config = {}
     column_order = labels.keys()  # Use labels keys for column order
 
@@ -260,14 +320,30 @@ def get_bleu_score_display(row):
     return "N/A"
 
 
-def render_metrics_summary(filtered_df, use_hospital_filter=True):
+def _summarize_frame(df):
+    """Compute the summary statistics of a frame directly, in the summarize_metrics format."""
+    summary = {"total_records": len(df)}
+    for col in ("Notes", "TenantId", "Note_Type"):
+        if col in df.columns:
+            summary[f"unique_{col}"] = df[col].nunique()
+    if "BLEU_Score_File" in df.columns:
+        summary["avg_score"] = df["BLEU_Score_File"].mean()
+    return summary
+
+
+def render_metrics_summary(filtered_df, use_hospital_filter=True, summary=None):
     """Render summary statistics for the filtered metrics.
     
     Args:
         filtered_df: DataFrame with applied filters
         use_hospital_filter: If True, show hospital count, if False, show tenant count
+        summary: Precomputed statistics from summarize_metrics; computed
+                 directly from filtered_df when not given
     """
-    if filtered_df.empty:
+    if summary is None:
+        summary = _summarize_frame(filtered_df)
+    
+    if summary["total_records"] == 0:
         st.warning("No data available for the selected filters.")
         return
     
@@ -275,98 +351,206 @@ def render_metrics_summary(filtered_df, use_hospital_filter=True):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Records", len(filtered_df))
+        st.metric("Total Records", summary["total_records"])
     
     with col2:
         if use_hospital_filter:
-            if "Notes" in filtered_df.columns:
-                unique_hospitals = filtered_df["Notes"].dropna().nunique()
-                st.metric("Unique Hospitals", unique_hospitals)
+            if "unique_Notes" in summary:
+                st.metric("Unique Hospitals", summary["unique_Notes"])
         else:
-            if "TenantId" in filtered_df.columns:
-                unique_tenants = filtered_df["TenantId"].nunique()
-                st.metric("Unique Tenants", unique_tenants)
+            if "unique_TenantId" in summary:
+                st.metric("Unique Tenants", summary["unique_TenantId"])
     
     with col3:
-        if "Note_Type" in filtered_df.columns:
-            unique_note_types = filtered_df["Note_Type"].nunique()
-            st.metric("Note Types", unique_note_types)
+        if "unique_Note_Type" in summary:
+            st.metric("Note Types", summary["unique_Note_Type"])
     
     with col4:
-        if "BLEU_Score_File" in filtered_df.columns:
-            avg_bleu = filtered_df["BLEU_Score_File"].mean()
+        if "avg_score" in summary:
+            avg_bleu = summary["avg_score"]
             if pd.notna(avg_bleu):
                 st.metric("Avg BLEU Score", f"{avg_bleu:.2f}")
 
 
-# def load_and_prepare_data(source, version_key="current", clinician_name=None):
-#     """Load and prepare metrics data for a specific source.
-    
-#     Args:
-#         source (str or InputSource): The input source (OPAS/SAAS).
-#         version_key (str, optional): The version key to use. Defaults to "current".
-#         clinician_name (str, optional): The clinician name for feedback links. Defaults to None.
-        
-#     Returns:
-#         pd.DataFrame: The prepared metrics dataframe.
-#     """
-#     from config.settings import InputSource
-    
-#     # Convert string source to InputSource enum if needed
-#     if isinstance(source, str):
-#         source = InputSource(source.lower())
-    
-#     # Get viewer list for passing to prepare_dataframe
-#     viewer_list = constants.ClinicianList.get_viewers()
-    
-#     # Load metrics data using the factory method
-#     df = get_metrics_df(clinician_name, viewer_list, source, version_key)
-    
-#     if df.empty:
-#         st.error(f"Failed to load {source.value.upper()} metrics data. Please check the metrics file path.")
-#         return None
-    
-#     return df
-
 def load_and_prepare_data(source, version_key="current", clinician_name=None):
-    """Load and prepare metrics data for a specific source using session state."""
+    """Load and prepare metrics data for a specific source.
+    
+    The base frame (with viewer links) is loaded once per source/version into
+    the process-wide shared store, so every session reads the same read-only
+    frame and switching clinicians never reloads it. The clinician's feedback
+    links are then derived with add_clinician_links.
+    """
     from config.settings import InputSource
     
-    # Create cache key based on source, version, and clinician
-    cache_key = f"metrics_data_{source}_{version_key}"
+    # Convert string source to InputSource enum if needed
+    if isinstance(source, str):
+        source = InputSource(source.lower())
     
-    # Check if we already have this data in session state
-    if cache_key not in st.session_state:
-        # Convert string source to InputSource enum if needed
-        if isinstance(source, str):
-            source = InputSource(source.lower())
-        
+    # No source selects the factory's default metrics file
+    source_value = source.value if source is not None else None
+    cache_key = ("metrics_data", source_value, version_key)
+    
+    def load():
         # Get viewer list for passing to prepare_dataframe
         viewer_list = constants.ClinicianList.get_viewers()
         
         # Load metrics data using the factory method
-        df = get_metrics_df(clinician_name, viewer_list, source, version_key)
-        
+        df = get_metrics_df(None, viewer_list, source, version_key)
         if df.empty:
-            st.error(f"Failed to load {source.value.upper()} metrics data. Please check the metrics file path.")
             return None
-            
-        # Store in session state for this user
-        st.session_state[cache_key] = df
+        
+        # Categoricals cut memory and let filters read options from categories
+        df = normalize_metrics_frame(df)
+        
+        # Build the filter index, option lists, summary cube and sort order
+        # once, while loading, rather than on the first rerun that needs them;
+        # clinician link frames inherit them through share_frame_artifacts
+        get_filter_index(df)
+        for col in ("Note_Type", "Notes", "TenantId"):
+            if col in df.columns:
+                get_column_options(df, col)
+        get_summary_cube(df)
+        get_sort_rank(df, [col for col in SORT_COLUMNS if col in df.columns])
+        return df
+    
+    df = frame_store.get_or_load(cache_key, load)
+    if df is None:
+        source_msg = f" {source_value.upper()}" if source_value else ""
+        st.error(f"Failed to load{source_msg} metrics data. Please check the metrics file path.")
+        return None
     
-    # Return data from session state
-    return st.session_state[cache_key]
+    return add_clinician_links(df, clinician_name)
 
-def render_metrics_table(filtered_df, labels, percent_columns=None):
-    """Render the metrics table with proper formatting."""
+
+def _build_clinician_links(urls, clinician_name):
+    """Point feedback URLs at a clinician, replacing any existing clinician parameter."""
+    urls = urls.astype("string")
+    # Drop an existing clinician parameter (a whole parameter, not a suffix of
+    # another name), then any dangling separator
+    base = urls.str.replace(
+        rf"(?<=[?&]){CLINICIAN_QUERY_PARAM}=[^&]*&?", "", regex=True
+    ).str.rstrip("?&")
+    separator = base.str.contains("?", regex=False).map({True: "&", False: "?"})
+    return base + separator + f"{CLINICIAN_QUERY_PARAM}={quote(clinician_name)}"
+
+
+def add_clinician_links(df, clinician_name):
+    """Get the metrics frame with feedback links for a clinician.
+    
+    Viewers (and no selection) get the shared base frame unchanged. For a
+    clinician the link column is rebuilt with one vectorised string operation
+    on a shallow copy, which shares the base frame's filter index, options and
+    summary cube. The copies of the MAX_CLINICIAN_LINK_FRAMES most recently
+    used clinicians are cached per base frame.
+    
+    Args:
+        df: Shared base metrics frame from load_and_prepare_data
+        clinician_name (str, optional): The selected clinician
+        
+    Returns:
+        pd.DataFrame: Frame whose feedback links carry the clinician name
+    """
+    url_col = constants.ColumnNames.FILE_NAME_URL_COL
+    viewer_list = constants.ClinicianList.get_viewers()
+    if not clinician_name or clinician_name in viewer_list or url_col not in df.columns:
+        return df
+    
+    linked_frames = get_frame_artifact(df, "clinician_links", OrderedDict)
+    with _clinician_links_lock:
+        linked_df = linked_frames.get(clinician_name)
+        if linked_df is not None:
+            linked_frames.move_to_end(clinician_name)
+            return linked_df
+    
+    linked_df = df.copy(deep=False)
+    linked_df[url_col] = _build_clinician_links(df[url_col], clinician_name)
+    # The cache of link frames itself stays with the base frame
+    share_frame_artifacts(df, linked_df, exclude=("clinician_links",))
+    
+    with _clinician_links_lock:
+        linked_frames[clinician_name] = linked_df
+        while len(linked_frames) > MAX_CLINICIAN_LINK_FRAMES:
+            linked_frames.popitem(last=False)
+    return linked_df
+
+def append_metrics_data(source, new_rows, version_key="current"):
+    """Append newly arrived rows to the shared metrics frame of a source.
+    
+    Used for append-only metrics files (see BlobStorageManager.refresh_csv_dataframe):
+    only the new rows are normalised and indexed, and the filter index, option
+    lists and summary cube of the current frame are extended rather than rebuilt.
+    
+    Args:
+        source (str or InputSource): The input source (OPAS/SAAS); None for the default source.
+        new_rows (pd.DataFrame): Rows to append, prepared like the loaded frame
+            (viewer feedback links included).
+        version_key (str, optional): The version key to use. Defaults to "current".
+        
+    Returns:
+        pd.DataFrame: The updated shared frame, or None if the source is not loaded.
+    """
+    source_value = getattr(source, "value", source)
+    if isinstance(source_value, str):
+        source_value = source_value.lower()
+    cache_key = ("metrics_data", source_value, version_key)
+    
+    df = frame_store.get(cache_key)
+    if df is None:
+        return None
+    if new_rows.empty:
+        return df
+    
+    # Only the appended rows are measured, not the whole grown frame
+    added_nbytes = int(new_rows.memory_usage(deep=True, index=False).sum())
+    return frame_store.extend(cache_key, append_metrics_rows(df, new_rows), added_nbytes)
+
+
+def invalidate_metrics_data(source=None, version_key=None):
+    """Drop shared metrics frames (and everything derived from them) so they reload.
+    
+    Args:
+        source (str or InputSource, optional): Only drop this source. Defaults to all sources.
+        version_key (str, optional): Only drop this version. Defaults to all versions.
+    """
+    source_value = getattr(source, "value", source)
+    if isinstance(source_value, str):
+        source_value = source_value.lower()
+    
+    def matches(key):
+        return (
+            key[0] == "metrics_data"
+            and (source_value is None or key[1] == source_value)
+            and (version_key is None or key[2] == version_key)
+        )
+    
+    # Filter indexes and option lists are keyed by frame, so once the frames are
+    # dropped they are released with them; clear them now rather than at GC.
+    # Frames of other sources and versions keep their artefacts.
+    for df in frame_store.invalidate(matches):
+        invalidate_frame_artifacts(df)
+
+
+def _prepare_display_frame(rows_df):
+    """Select the display columns of some rows and blank out missing values."""
     # Get display columns and create dataframe
     display_columns = get_display_columns()
     
     # Filter display columns to only include those that exist in the dataframe
-    existing_display_columns = [col for col in display_columns if col in filtered_df.columns]
+    existing_display_columns = [col for col in display_columns if col in rows_df.columns]
     
-    display_df = filtered_df[existing_display_columns].copy()
-    display_df = display_df.where(pd.notnull(display_df), "")
+    display_df = rows_df[existing_display_columns].copy()
+    # Categorical columns cannot take "" as a fill value, so show them as plain text
+    categorical_columns = [
+        col for col in existing_display_columns
+        if isinstance(display_df[col].dtype, pd.CategoricalDtype)
+    ]
+    display_df = display_df.astype({col: object for col in categorical_columns})
+    return display_df.where(pd.notnull(display_df), "")
+
+
+def render_metrics_table(filtered_df, labels, percent_columns=None):
+    """Render the metrics table with proper formatting."""
+    display_df = _prepare_display_frame(filtered_df)
     
     # Create column configuration and display dataframe
     column_config = create_column_config(labels, percent_columns)
@@ -378,6 +562,52 @@ def render_metrics_table(filtered_df, labels, percent_columns=None):
     )
 
 
+def render_metrics_table_paged(df, selections, labels, percent_columns=None,
+                               page_size=DEFAULT_PAGE_SIZE, key="metrics_table"):
+    """Render one page of the filtered metrics, sorted by TenantId and AssessmentId.
+    
+    Only the rows of the visible page are sliced, null-filled and sent to the
+    browser; the matching row count comes from the filter index.
+    
+    Args:
+        df: Unfiltered (loaded) metrics DataFrame
+        selections: Filter selections from build_filter_selections
+        labels: Column labels for the column configuration
+        percent_columns: Columns shown as percentages
+        page_size: Number of rows per page
+        key: Widget key prefix, unique per table on the page
+        
+    Returns:
+        int: Number of rows matching the selections
+    """
+    sort_columns = [col for col in SORT_COLUMNS if col in df.columns]
+    rows = get_filter_index(df).select(selections)
+    total_rows = len(df) if rows is None else len(rows)
+    
+    num_pages = max(1, -(-total_rows // page_size))
+    page_index = st.number_input(
+        f"Page (of {num_pages})",
+        min_value=1,
+        max_value=num_pages,
+        value=1,
+        step=1,
+        key=f"{key}_page"
+    ) - 1
+    
+    page_rows = page_row_positions(df, rows, sort_columns, page_size, page_index)
+    display_df = _prepare_display_frame(df.take(page_rows))
+    
+    st.caption(
+        f"Showing rows {page_index * page_size + 1 if total_rows else 0}"
+        f"–{page_index * page_size + len(page_rows)} of {total_rows}"
+    )
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        column_config=create_column_config(labels, percent_columns)
+    )
+    return total_rows
+
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -454,67 +684,16 @@ def select_clinician():
   
         )
     
-    # Update the session state manually
+    # Update the session state manually; links are re-derived per clinician,
+    # so there is no need to clear the data cache or rerun
     if selection != st.session_state.clinician_name:
         st.session_state.clinician_name = selection
-        # Force cache invalidation for the dataframe
-        st.cache_data.clear()
-        # Rerun the app to apply changes
-        st.rerun()
     
     # Debug output - should now show the correct selection
     st.write(f"Current selection: {selection}")
     
     return selection
 
-def create_filters(df):
-    """Create filter controls and return selected values."""
-    st.subheader("Filter Metrics")
-    
-    # Clinician selection is moved to a separate function
-    
-    col1, col2, col3 = st.columns(3)
-
-    
-    with col1:
-        # Filter by accuracy level
-        selected_accuracy = st.selectbox(
-            "Filter by similarity level",
-            constants.Accuracy.get_all_levels() 
-        )
-    
-    with col2:
-        # Filter by note type
-        note_type_list = sorted(df["Note_Type"].unique().tolist())
-        print("Note Type column check ", note_type_list)
-        note_type_list = [ALL_TYPES] + note_type_list
-        selected_note_type = st.selectbox("Filter by Note Type", note_type_list)
-    
-    with col3:
-        # Filter by tenant
-        tenants_list = sorted(df["TenantId"].unique().astype(str).tolist())
-        print("Tenant column check ", tenants_list)
-        tenants = [ALL_TENANTS] + tenants_list
-        selected_tenant = st.selectbox("Filter by Tenant", tenants)
-    
-    return selected_accuracy, selected_note_type, selected_tenant
-
-def apply_filters(df, selected_accuracy, selected_note_type, selected_tenant):
-    """Apply filters to the dataframe."""
-    filtered_df = df.copy()
-    
-    if selected_accuracy != ALL_LEVELS:
-        filtered_df = filtered_df[filtered_df["Accuracy"] == selected_accuracy]
-    
-    if selected_note_type != ALL_TYPES and "Note_Type" in df.columns:
-        filtered_df = filtered_df[filtered_df["Note_Type"] == selected_note_type]
-    
-    if selected_tenant != ALL_TENANTS and "TenantId" in df.columns:
-        filtered_df = filtered_df[filtered_df["TenantId"].astype(str) == selected_tenant]
-    
-    return filtered_df
-  
-
 def get_display_columns():
     """Get the columns to display ."""
     base_columns = [constants.ColumnNames.FILE_NAME_URL_COL]
@@ -523,49 +702,29 @@ def get_display_columns():
     display_columns = base_columns + list(constants.MetricsColumns.DISPLAY_COLUMNS)
     return display_columns
 
-def create_column_config():
-
-    # Add number column configs for existing columns
-
-
-    column_config = {}  
-    column_order = LABELS.keys()  # Use LABELS keys for column order
-
-    for col in column_order:  
-        # pick a user-friendly label (fallback to raw name)  
-        nice_label = LABELS.get(col, col)  
-
-        if col == constants.ColumnNames.FILE_NAME_URL_COL:  
-            # clickable link to your feedback page  
-            column_config[col] = st.column_config.LinkColumn(  
-                label=nice_label,      
-                width="small",
-                display_text = "Open Feedback"  # Display text for the link
-            )  
-  
-        elif col in constants.MetricsColumns.PERCENT_COLUMNS:  
-            # BLEU percent columns  
-            column_config[col] = st.column_config.NumberColumn(  
-                label=nice_label,  
-                format=f"%.{DECIMAL_PLACES}f%%",  
-                width="small",  
-            )  
-  
-        elif col in constants.MetricsColumns.NUMBER_COLUMNS:  
-            # any other number columns you declared  
-            column_config[col] = st.column_config.NumberColumn(  
-                label=nice_label,  
-                width="small"  
-            )  
-  
-        else:  
-            # everything else as plain text  
-            column_config[col] = st.column_config.TextColumn(  
-                label=nice_label,  
-                width="auto",  
-            )  
-  
-    return column_config  
+def create_column_config(labels=None, percent_columns=None):
+    """Create column configuration for dataframe display.
+    
+    The configuration only depends on the labels and percent columns, so it is
+    built once per distinct combination and reused on later reruns.
+    
+    Args:
+        labels: Column labels, in display order; defaults to LABELS
+        percent_columns: Columns shown as percentages; defaults to
+                         constants.MetricsColumns.PERCENT_COLUMNS
+    """
+    if labels is None:
+        labels = LABELS
+    if percent_columns is None:
+        percent_columns = constants.MetricsColumns.PERCENT_COLUMNS
+    
+    cache_key = (tuple(labels.items()), tuple(percent_columns))
+    column_config = _column_config_cache.get(cache_key)
+    if column_config is None:
+        column_config = _build_column_config(labels, percent_columns)
+        _column_config_cache[cache_key] = column_config
+    
+    return dict(column_config)
 
 
 def get_bleu_score_display(row):
@@ -582,47 +741,23 @@ def render_metrics_page():
     # Add clinician selection at the top of the page
     clinician_name = select_clinician()
     
-    # Load metrics data - with source parameter
-    from config.settings import InputSource
+    # Load metrics data - with source parameter. The base frame is shared and
+    # only its feedback links are rebuilt when the clinician changes
     source = st.session_state.get("selected_source", None)  # Get source from session state if available
-    df = read_metrics_file(source=source)
-    
-    if df.empty:
-        source_msg = f" for {source.value}" if source else ""
-        st.error(f"Failed to load metrics data{source_msg}. Please check the metrics file path.")
-        return
-    
-    # Get viewer list for passing to prepare_dataframe
-    viewer_list = constants.ClinicianList.get_viewers()
-    
-    # Prepare dataframe with clinician parameter in links - pass clinician_name explicitly
-    df = prepare_dataframe(df, clinician_name, viewer_list)
+    df = load_and_prepare_data(source, clinician_name=clinician_name)
     if df is None:
         return
     
     # Create filters
-    selected_accuracy, selected_note_type, selected_tenant = create_filters(df)
+    selected_accuracy, selected_note_type, selected_tenant = create_filters(df, use_hospital_filter=False)
     # print("Selected filters:", selected_accuracy, selected_note_type, selected_tenant)
     
-    # Apply filters
-    filtered_df = apply_filters(df, selected_accuracy, selected_note_type, selected_tenant)
-    
-    # Sort the dataframe by TenantId and AssessmentId
-    if "TenantId" in filtered_df.columns and "AssessmentId" in filtered_df.columns:
-        filtered_df = filtered_df.sort_values(by=["TenantId", "AssessmentId"])
-    
-    # Display filtered metrics
-    st.subheader(f"Assessment Metrics ({len(filtered_df)} records)")
-    
-    # Get display columns and create dataframe
-    display_columns = get_display_columns()
-    display_df = filtered_df[display_columns].copy()
-    display_df = display_df.where(pd.notnull(display_df), "")
+    selections = build_filter_selections(
+        selected_accuracy, selected_note_type, selected_tenant, use_hospital_filter=False
+    )
     
-    # Create column configuration and display dataframe
-    column_config = create_column_config()
-    st.dataframe(
-        display_df,
-        use_container_width=True,
-        column_config=column_config
-    )    
+    # Display filtered metrics one page at a time, sorted by TenantId and
+    # AssessmentId; the record count is known once the page is rendered
+    header = st.empty()
+    total_rows = render_metrics_table_paged(df, selections, LABELS)
+    header.subheader(f"Assessment Metrics ({total_rows} records)")
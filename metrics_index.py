@@ -0,0 +1,481 @@
+"""
+Precomputed lookup structures for the metrics pages (OPAS, SAAS, etc.)
+
+Metrics frames are loaded once and shared read-only between sessions, so
+anything derived purely from a frame is built once per frame and reused on
+every rerun instead of rescanning the rows.
+"""
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Columns the metrics filters select on
+FILTER_COLUMNS = ("Accuracy", "Note_Type", "Notes", "TenantId")
+
+# Low-cardinality text columns stored as categoricals after loading
+CATEGORICAL_COLUMNS = ("Accuracy", "Note_Type", "Notes", "TenantId", "Physician_Recommendation")
+
+
+def normalize_metrics_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the low-cardinality text columns of a metrics frame to categoricals.
+
+    Values are canonicalised to their string form (so e.g. integer tenant ids
+    compare equal to the selectbox strings) while missing values stay missing.
+    Categories are sorted, which also gives the filter option lists their order.
+
+    Args:
+        df: Freshly loaded metrics frame (modified in place)
+
+    Returns:
+        pandas.DataFrame: The normalised frame
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            canonical = df[col].map(str, na_action="ignore")
+            df[col] = pd.Categorical(canonical, categories=sorted(canonical.dropna().unique()))
+    return df
+
+
+class FilterIndex:
+    """Per-column value -> row-position index over a metrics frame.
+
+    Values are indexed by their string form, matching how the filter
+    selectboxes present them. Row positions are sorted ascending, so the rows
+    of a multi-column selection are the intersection of the per-column arrays.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns=FILTER_COLUMNS):
+        """
+        Build the index.
+
+        Args:
+            df: Metrics frame to index
+            columns: Columns to index; columns missing from the frame are skipped
+        """
+        self.num_rows = len(df)
+        self.positions: Dict[str, Dict[str, np.ndarray]] = {}
+        for col in columns:
+            if col in df.columns:
+                self.positions[col] = self._build_column(df[col])
+
+    @staticmethod
+    def _build_column(values: pd.Series) -> Dict[str, np.ndarray]:
+        """Group the row positions of a column by string value."""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Reuse the categorical codes; missing values (code -1) index as "nan"
+            # like astype(str) would render them
+            codes = values.cat.codes.to_numpy().astype(np.intp)
+            uniques = [str(category) for category in values.cat.categories]
+            if (codes < 0).any():
+                codes = np.where(codes < 0, len(uniques), codes)
+                uniques.append("nan")
+        else:
+            codes, uniques = pd.factorize(values.astype(str))
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        return {
+            value: order[bounds[i]:bounds[i + 1]]
+            for i, value in enumerate(uniques)
+        }
+
+    def extended(self, new_rows: pd.DataFrame) -> "FilterIndex":
+        """
+        Get an index of this frame with rows appended, indexing only the new rows.
+
+        Args:
+            new_rows: Rows appended after the indexed frame's last row
+
+        Returns:
+            FilterIndex: New index; this one is left untouched for frames still in use
+        """
+        index = FilterIndex.__new__(FilterIndex)
+        index.num_rows = self.num_rows + len(new_rows)
+        index.positions = {}
+        for col, column_index in self.positions.items():
+            merged = dict(column_index)
+            if col in new_rows.columns:
+                for value, rows in self._build_column(new_rows[col]).items():
+                    rows = rows + self.num_rows
+                    old_rows = merged.get(value)
+                    # New positions are all past the old ones, so this stays sorted
+                    merged[value] = rows if old_rows is None else np.concatenate([old_rows, rows])
+            index.positions[col] = merged
+        return index
+
+    def select(self, selections: Dict[str, str]) -> Optional[np.ndarray]:
+        """
+        Get the row positions matching every selection.
+
+        Args:
+            selections: Column name to selected value; unindexed columns are ignored
+
+        Returns:
+            numpy.ndarray: Sorted row positions, or None if nothing was selected
+        """
+        result = None
+        for col, value in selections.items():
+            column_index = self.positions.get(col)
+            if column_index is None:
+                continue
+            rows = column_index.get(str(value), np.empty(0, dtype=np.intp))
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+        return result
+
+    def filter(self, df: pd.DataFrame, selections: Dict[str, str]) -> pd.DataFrame:
+        """
+        Get the rows of the indexed frame matching every selection.
+
+        Args:
+            df: The frame this index was built from
+            selections: Column name to selected value
+
+        Returns:
+            pandas.DataFrame: Matching rows; the frame itself when nothing is selected
+        """
+        rows = self.select(selections)
+        if rows is None:
+            return df
+        return df.take(rows)
+
+
+class SummaryCube:
+    """Row counts and BLEU sums per combination of the filter dimensions.
+
+    Distinct counts are not additive, so the cube keeps one row per observed
+    (Accuracy, Note_Type, Notes, TenantId) combination; a filter selection is
+    answered by narrowing this small frame instead of the metrics rows.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns=FILTER_COLUMNS, score_column: str = "BLEU_Score_File"):
+        """
+        Build the cube.
+
+        Args:
+            df: Metrics frame to aggregate
+            columns: Filter dimensions; columns missing from the frame are skipped
+            score_column: Column whose mean is reported
+        """
+        self.dims = [col for col in columns if col in df.columns]
+        self.has_score = score_column in df.columns
+
+        if self.dims:
+            grouped = df.groupby(self.dims, dropna=False, observed=True, sort=False)
+            cube = grouped.size().rename("count").to_frame()
+            if self.has_score:
+                cube["score_sum"] = grouped[score_column].sum()
+                cube["score_count"] = grouped[score_column].count()
+            self.cube = cube.reset_index()
+        else:
+            cube = {"count": [len(df)]}
+            if self.has_score:
+                cube["score_sum"] = [df[score_column].sum()]
+                cube["score_count"] = [df[score_column].count()]
+            self.cube = pd.DataFrame(cube)
+
+    def merged(self, new_rows: pd.DataFrame) -> "SummaryCube":
+        """
+        Get a cube covering this frame plus appended rows, aggregating only the new rows.
+
+        Args:
+            new_rows: Rows appended to the aggregated frame
+
+        Returns:
+            SummaryCube: New cube; this one is left untouched
+        """
+        new_cube = SummaryCube(new_rows, columns=self.dims)
+        cube = SummaryCube.__new__(SummaryCube)
+        cube.dims = self.dims
+        cube.has_score = self.has_score and new_cube.has_score
+        combined = pd.concat([self.cube, new_cube.cube], ignore_index=True)
+        if self.dims:
+            # Categories of old and new rows may differ; the cube is small, so
+            # regroup on plain values
+            combined = combined.astype({col: object for col in self.dims})
+            combined = combined.groupby(self.dims, dropna=False, sort=False).sum().reset_index()
+        else:
+            combined = combined.sum().to_frame().T
+        if not cube.has_score:
+            combined = combined.drop(columns=["score_sum", "score_count"], errors="ignore")
+        cube.cube = combined
+        return cube
+
+    def summarize(self, selections: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Get the summary statistics of the rows matching every selection.
+
+        Args:
+            selections: Column name to selected value
+
+        Returns:
+            dict: ``total_records``, ``unique_<column>`` for each dimension
+            (missing values excluded) and ``avg_score`` when the score column exists
+        """
+        rows = self.cube
+        for col, value in selections.items():
+            if col in self.dims:
+                rows = rows[rows[col].astype(str) == str(value)]
+
+        summary = {"total_records": int(rows["count"].sum())}
+        for col in self.dims:
+            summary[f"unique_{col}"] = int(rows[col].nunique())
+        if self.has_score:
+            score_count = rows["score_count"].sum()
+            summary["avg_score"] = rows["score_sum"].sum() / score_count if score_count else np.nan
+        return summary
+
+
+# Artefacts derived from a (shared, read-only) frame, keyed by its id()
+_frame_artifacts: Dict[int, tuple] = {}
+_frame_artifacts_lock = threading.Lock()
+
+
+def get_frame_artifact(df: pd.DataFrame, name: Hashable, build: Callable[[], Any]) -> Any:
+    """
+    Get an artefact derived from a frame, building it on first use.
+
+    Args:
+        df: Frame the artefact describes; must not be modified in place afterwards
+        name: Name of the artefact
+        build: Callable producing the artefact
+
+    Returns:
+        The cached or newly built artefact
+    """
+    key = id(df)
+    with _frame_artifacts_lock:
+        cached = _frame_artifacts.get(key)
+        if cached is not None and cached[0]() is df and name in cached[1]:
+            return cached[1][name]
+
+    artifact = build()
+    with _frame_artifacts_lock:
+        # Drop artefacts of frames that have been garbage collected
+        for stale_key in [k for k, (ref, _) in _frame_artifacts.items() if ref() is None]:
+            del _frame_artifacts[stale_key]
+        cached = _frame_artifacts.get(key)
+        if cached is None or cached[0]() is not df:
+            cached = (weakref.ref(df), {})
+            _frame_artifacts[key] = cached
+        cached[1][name] = artifact
+    return artifact
+
+
+def share_frame_artifacts(source_df: pd.DataFrame, derived_df: pd.DataFrame,
+                          exclude: tuple = ()) -> None:
+    """
+    Let a derived frame reuse the artefacts already built for its source frame.
+
+    Only valid when both frames have the same rows and identical filter/sort
+    columns, e.g. a shallow copy with one display column replaced.
+
+    Args:
+        source_df: Frame whose artefacts are shared
+        derived_df: Frame that should see the same artefacts
+        exclude: Names of artefacts not to share, e.g. ones holding derived frames
+    """
+    with _frame_artifacts_lock:
+        cached = _frame_artifacts.get(id(source_df))
+        if cached is None or cached[0]() is not source_df:
+            cached = (weakref.ref(source_df), {})
+            _frame_artifacts[id(source_df)] = cached
+        # Copy the mapping rather than aliasing it: the source's artefacts may
+        # hold the derived frame itself, which would otherwise keep both alive
+        shared = {name: artifact for name, artifact in cached[1].items() if name not in exclude}
+        _frame_artifacts[id(derived_df)] = (weakref.ref(derived_df), shared)
+
+
+def append_metrics_rows(df: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Append rows to a metrics frame, extending its artefacts instead of rebuilding them.
+
+    The new rows are normalised onto the frame's categories (new values are
+    added as extra categories, so existing codes are kept), the filter index is
+    extended with the new row positions and the summary cube merged with an
+    aggregate of just the new rows. The input frame is not modified.
+
+    Args:
+        df: Normalised metrics frame, as produced by normalize_metrics_frame
+        new_rows: Rows to append, prepared the same way as ``df``
+
+    Returns:
+        pandas.DataFrame: New frame with the rows appended
+    """
+    base = df.copy(deep=False)
+    new_rows = new_rows.copy(deep=False)
+    for col in CATEGORICAL_COLUMNS:
+        if col not in base.columns or not isinstance(base[col].dtype, pd.CategoricalDtype):
+            continue
+        canonical = new_rows[col].map(str, na_action="ignore") if col in new_rows.columns else None
+        if canonical is not None:
+            known = set(base[col].cat.categories)
+            missing = sorted(set(canonical.dropna()) - known)
+            if missing:
+                base[col] = base[col].cat.add_categories(missing)
+            new_rows[col] = pd.Categorical(canonical, categories=base[col].cat.categories)
+
+    offset = len(df)
+    new_rows.index = pd.RangeIndex(offset, offset + len(new_rows))
+    combined = pd.concat([base, new_rows])
+
+    with _frame_artifacts_lock:
+        cached = _frame_artifacts.get(id(df))
+        artifacts = dict(cached[1]) if cached is not None and cached[0]() is df else {}
+
+    carried = {}
+    if "filter_index" in artifacts:
+        carried["filter_index"] = artifacts["filter_index"].extended(new_rows)
+    if "summary_cube" in artifacts:
+        carried["summary_cube"] = artifacts["summary_cube"].merged(new_rows)
+    for name, options in artifacts.items():
+        if isinstance(name, tuple) and name[0] == "options" and name[1] in new_rows.columns:
+            added = new_rows[name[1]].dropna().astype(str).unique().tolist()
+            carried[name] = sorted(set(options).union(added))
+
+    with _frame_artifacts_lock:
+        _frame_artifacts[id(combined)] = (weakref.ref(combined), carried)
+    return combined
+
+
+def invalidate_frame_artifacts(df: Optional[pd.DataFrame] = None) -> None:
+    """
+    Drop cached artefacts so they are rebuilt on next use.
+
+    Args:
+        df: Only drop the artefacts of this frame; None drops all of them
+    """
+    with _frame_artifacts_lock:
+        if df is None:
+            _frame_artifacts.clear()
+        else:
+            _frame_artifacts.pop(id(df), None)
+
+
+def get_filter_index(df: pd.DataFrame) -> FilterIndex:
+    """
+    Get the filter index of a frame, building it on first use.
+
+    Args:
+        df: Metrics frame; must not be modified in place after indexing
+
+    Returns:
+        FilterIndex: Index of the frame
+    """
+    return get_frame_artifact(df, "filter_index", lambda: FilterIndex(df))
+
+
+def get_summary_cube(df: pd.DataFrame) -> SummaryCube:
+    """
+    Get the summary cube of a frame, building it on first use.
+
+    Args:
+        df: Metrics frame; must not be modified in place afterwards
+
+    Returns:
+        SummaryCube: Cube of the frame
+    """
+    return get_frame_artifact(df, "summary_cube", lambda: SummaryCube(df))
+
+
+def _category_sort_keys(categories: pd.Index) -> np.ndarray:
+    """
+    Get sort keys for categories canonicalised to strings by normalize_metrics_frame.
+
+    Categories that all look numeric (e.g. integer tenant ids) are compared
+    as numbers, so "9" sorts before "10" as the original column did; anything
+    else is compared as text.
+    """
+    numeric = pd.to_numeric(pd.Series(categories, dtype=object), errors="coerce")
+    if len(categories) and numeric.notna().all():
+        return numeric.to_numpy()
+    return categories.astype(str).to_numpy()
+
+
+def get_sort_rank(df: pd.DataFrame, columns: List[str]) -> tuple:
+    """
+    Get the sorted row order of a frame and each row's rank in it.
+
+    Args:
+        df: Metrics frame; must not be modified in place afterwards
+        columns: Columns to sort by
+
+    Returns:
+        tuple: (row positions in sorted order, rank of each row position)
+    """
+    def build() -> tuple:
+        positions = pd.RangeIndex(len(df))
+        if columns:
+            keys = {}
+            for col in columns:
+                values = df[col]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    # Sort by category value rather than category order, which
+                    # is no longer sorted once rows have been appended
+                    category_rank = np.argsort(np.argsort(_category_sort_keys(values.cat.categories)))
+                    # Missing values (code -1) pick the appended rank and sort last
+                    category_rank = np.append(category_rank, len(category_rank))
+                    keys[col] = category_rank[values.cat.codes.to_numpy()]
+                else:
+                    keys[col] = values.to_numpy()
+            keyed = pd.DataFrame(keys, index=positions)
+            order = keyed.sort_values(columns, kind="mergesort").index.to_numpy()
+        else:
+            order = positions.to_numpy()
+        rank = np.empty(len(order), dtype=np.intp)
+        rank[order] = np.arange(len(order))
+        return order, rank
+
+    return get_frame_artifact(df, ("sort_rank", tuple(columns)), build)
+
+
+def page_row_positions(df: pd.DataFrame, rows: Optional[np.ndarray], sort_columns: List[str],
+                       page_size: int, page_index: int) -> np.ndarray:
+    """
+    Get the row positions of one page of a sorted selection.
+
+    The sort order of the whole frame is computed once; a selection is ordered
+    by looking up its rows' ranks, and an unfiltered frame is paged directly.
+
+    Args:
+        df: Metrics frame the rows belong to
+        rows: Selected row positions, or None for every row
+        sort_columns: Columns to sort by
+        page_size: Number of rows per page
+        page_index: Zero-based page number
+
+    Returns:
+        numpy.ndarray: Row positions of the page, in display order
+    """
+    order, rank = get_sort_rank(df, sort_columns)
+    start = page_index * page_size
+    if rows is None:
+        return order[start:start + page_size]
+    ordered = rows[np.argsort(rank[rows], kind="stable")]
+    return ordered[start:start + page_size]
+
+
+def get_column_options(df: pd.DataFrame, col: str) -> List[str]:
+    """
+    Get the sorted distinct non-missing values of a column as strings.
+
+    For normalised (categorical) columns this reads the categories instead of
+    scanning the rows.
+
+    Args:
+        df: Metrics frame; must not be modified in place afterwards
+        col: Column name
+
+    Returns:
+        list: Sorted option strings
+    """
+    def build() -> List[str]:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            used = values.cat.remove_unused_categories().cat.categories
+            return sorted(str(category) for category in used)
+        return sorted(values.dropna().astype(str).unique().tolist())
+
+    return get_frame_artifact(df, ("options", col), build)
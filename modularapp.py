@@ -1,10 +1,13 @@
 import streamlit as st
-from utils.state import sync_param_to_state
-from utils.user import select_clinician
-from components.sidebar_info import render_sidebar_info
-from config.settings import app_config as AppConfig
-from utils.blobaccess import BlobAccessUtil
-from utils.logging_config import configure_logging
+from page_registry import lazy_page, profile_block, render_import_profile_page, timed_import
+
+# Timed per module on the first (cold) import; later reruns reuse the loaded modules
+sync_param_to_state = timed_import("utils.state", kind="startup").sync_param_to_state
+select_clinician = timed_import("utils.user", kind="startup").select_clinician
+render_sidebar_info = timed_import("components.sidebar_info", kind="startup").render_sidebar_info
+AppConfig = timed_import("config.settings", kind="startup").app_config
+get_shared_blob_util = timed_import("shared_cache", kind="startup").get_shared_blob_util
+configure_logging = timed_import("utils.logging_config", kind="startup").configure_logging
 
 import os
 import sys
@@ -16,7 +19,8 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 load_dotenv(override=True)
 
 # Configure logging
-configure_logging()
+with profile_block("startup: logging setup"):
+    configure_logging()
 
 # Set Streamlit page config
 st.set_page_config(
@@ -48,8 +52,9 @@ div[data-baseweb="select"] {
 """, unsafe_allow_html=True)
 
 # Load configuration and initialize shared utilities
-storage_config = AppConfig.get_azure_storage_config()
-blob_util = BlobAccessUtil(storage_config["connection_string"], storage_config["container_name"])
+with profile_block("startup: blob utility"):
+    storage_config = AppConfig.get_azure_storage_config()
+    blob_util = get_shared_blob_util(storage_config["connection_string"], storage_config["container_name"])
 
 # Set shared session state
 st.session_state.setdefault("app_config", AppConfig)
@@ -64,38 +69,40 @@ with st.sidebar:
     clinician_name = select_clinician()
     render_sidebar_info(storage_config)
 
-# Define pages
-from pages.assessment.overview import render_overview_page
-from pages.assessment.metrics_saas import render_metrics_page as render_saas
-from pages.assessment.metrics_opas import render_metrics_page as render_opas
-from pages.assessment.assessment_viewer import render_feedback_page
-from pages.summarization.overview import render_summary_overview_page
-from pages.summarization.note_list import render_summary_list_page
-from pages.summarization.note_detail import render_summary_detail_page
-
+# Define pages; each page module is imported the first time the page is opened
 home = st.Page(lambda: st.title("Clinical Documentation AI Tools"), title="Home", icon="\U0001F3E0")
 
 assessment_pages = [
-    st.Page(render_overview_page, title="Overview", icon="\U0001F4CA")
+    lazy_page("pages.assessment.overview", "render_overview_page", "Overview", "\U0001F4CA")
 ]
 
 if clinician_name:
     assessment_pages += [
-        st.Page(render_saas, title="Saas Metrics List", icon="\U0001F4C1"),
-        st.Page(render_opas, title="OPAS File List", icon="\U0001F4C8"),
-        st.Page(render_feedback_page, title="Note", icon="\U0001F4AC")
+        lazy_page("pages.assessment.metrics_saas", "render_metrics_page", "Saas Metrics List", "\U0001F4C1",
+                  url_path="assessment_metrics_saas"),
+        lazy_page("pages.assessment.metrics_opas", "render_metrics_page", "OPAS File List", "\U0001F4C8",
+                  url_path="assessment_metrics_opas"),
+        lazy_page("pages.assessment.assessment_viewer", "render_feedback_page", "Note", "\U0001F4AC")
     ]
 
 summarization_pages = [
-    st.Page(render_summary_overview_page, title="Dashboard", icon="\U0001F4CB"),
-    st.Page(render_summary_list_page, title="Summarized Notes", icon="\U0001F4DD"),
-    st.Page(render_summary_detail_page, title="Note Detail", icon="\U0001F50D")
+    lazy_page("pages.summarization.overview", "render_summary_overview_page", "Dashboard", "\U0001F4CB"),
+    lazy_page("pages.summarization.note_list", "render_summary_list_page", "Summarized Notes", "\U0001F4DD"),
+    lazy_page("pages.summarization.note_detail", "render_summary_detail_page", "Note Detail", "\U0001F50D")
 ]
 
-# Navigation
-pg = st.navigation({
+navigation = {
     "Clinical AI Tools": [home],
     "Assessment Extraction": assessment_pages,
     "Summarization": summarization_pages
-})
+}
+
+# Import profile debug page, only outside production
+if st.session_state.environment != "production":
+    navigation["Debug"] = [
+        st.Page(render_import_profile_page, title="Import Profile", icon="\u23F1", url_path="import_profile")
+    ]
+
+# Navigation
+pg = st.navigation(navigation)
 pg.run()
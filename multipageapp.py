@@ -12,7 +12,7 @@ load_dotenv(override=True)
 
 # Import and initialize Pydantic-based configuration
 from config.settings import app_config as AppConfig
-from utils.blobaccess import BlobAccessUtil
+from shared_cache import get_shared_blob_util
 from utils.logging_config import configure_logging
 
 # Configure logging at the start of the application
@@ -21,8 +21,8 @@ configure_logging()
 # Get Azure Storage configuration from Pydantic settings
 storage_config = AppConfig.get_azure_storage_config()
 
-# Initialize global blob utility instance
-blob_util = BlobAccessUtil(
+# Process-wide blob utility instance, shared by all sessions and reruns
+blob_util = get_shared_blob_util(
     storage_config["connection_string"], 
     storage_config["container_name"]
 )
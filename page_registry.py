@@ -0,0 +1,140 @@
+"""
+Lazy page registry and import-time profiling for modularapp.py.
+
+Pages are registered by module path; a page's module is imported the first
+time the page is opened rather than on every script run. Import and startup
+timings are collected process-wide and shown on the import profile debug page.
+"""
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import streamlit as st
+
+# label -> {"kind", "first_seconds", "max_seconds", "count"}; shared by every
+# session of the process, so the cold-start cost of the first run is kept
+_import_profile: Dict[str, Dict[str, Any]] = {}
+_profile_lock = threading.Lock()
+
+
+def _record(label: str, seconds: float, kind: str) -> None:
+    """Store a timing of a label, keeping its first and maximum values."""
+    with _profile_lock:
+        entry = _import_profile.get(label)
+        if entry is None:
+            _import_profile[label] = {
+                "kind": kind,
+                "first_seconds": seconds,
+                "max_seconds": seconds,
+                "count": 1,
+            }
+            return
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+        entry["count"] += 1
+
+
+def timed_import(module_name: str, kind: str = "page"):
+    """
+    Import a module, recording the cost of its first (uncached) import.
+
+    Modules already loaded (on a later rerun, or as a dependency of an earlier
+    import) are returned without recording anything.
+
+    Args:
+        module_name: Dotted module path
+        kind: Category shown in the import profile, e.g. "startup" or "page"
+
+    Returns:
+        module: The imported module
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    _record(module_name, time.perf_counter() - started, kind)
+    return module
+
+
+@contextmanager
+def profile_block(label: str) -> Iterator[None]:
+    """
+    Time a block of startup work (e.g. configuration) on every run.
+
+    Args:
+        label: Name shown in the import profile
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(label, time.perf_counter() - started, "startup")
+
+
+def lazy_page(module_name: str, function_name: str, title: str, icon: Optional[str] = None,
+              url_path: Optional[str] = None) -> "st.Page":
+    """
+    Create a page whose module is imported only when the page is first run.
+
+    Args:
+        module_name: Dotted path of the page module
+        function_name: Render function inside the module
+        title: Navigation title
+        icon: Navigation icon
+        url_path: URL path; defaults to the render function name, as st.Page
+            would derive it from an eagerly imported function
+
+    Returns:
+        streamlit.Page: Page for st.navigation
+    """
+    def render():
+        getattr(timed_import(module_name, kind="page"), function_name)()
+
+    return st.Page(render, title=title, icon=icon, url_path=url_path or function_name)
+
+
+def get_import_profile() -> List[Dict[str, Any]]:
+    """
+    Get the recorded timings, most expensive first.
+
+    Returns:
+        list: One dict per label with ``name``, ``kind``, ``first_seconds``,
+        ``max_seconds`` and ``count``
+    """
+    with _profile_lock:
+        rows = [{"name": name, **entry} for name, entry in _import_profile.items()]
+    return sorted(rows, key=lambda row: row["max_seconds"], reverse=True)
+
+
+def render_import_profile_page() -> None:
+    """Debug page listing startup and page module import costs."""
+    st.title("Import Profile")
+    st.write(
+        "Modules are timed on their first import in this process (later runs "
+        "reuse the loaded module); startup blocks are timed on every run and "
+        "keep their first and slowest timing."
+    )
+
+    rows = get_import_profile()
+    if not rows:
+        st.info("No imports recorded yet.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        cold_start = sum(r["first_seconds"] for r in rows if r["kind"] == "startup")
+        st.metric("Cold start (first run)", f"{cold_start:.3f}s")
+    with col2:
+        st.metric("Page modules loaded", sum(1 for r in rows if r["kind"] == "page"))
+
+    st.dataframe(
+        [
+            {**row, "first_seconds": round(row["first_seconds"], 4), "max_seconds": round(row["max_seconds"], 4)}
+            for row in rows
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
@@ -0,0 +1,201 @@
+"""
+Process-wide caches shared by every Streamlit session.
+
+Streamlit re-executes page scripts on each interaction and keeps
+``st.session_state`` per browser session, so anything stored there is
+duplicated once per reviewer. Clients are cached with ``st.cache_resource``
+and DataFrames in a ``SharedFrameStore``: one immutable copy per process,
+bounded by a TTL and a memory cap.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import pandas as pd
+import streamlit as st
+
+DEFAULT_TTL_SECONDS = int(os.getenv('SHARED_CACHE_TTL_SECONDS', '3600'))
+DEFAULT_MAX_BYTES = int(os.getenv('SHARED_CACHE_MAX_BYTES', str(2 * 1024 * 1024 * 1024)))
+
+
+class SharedFrameStore:
+    """Thread-safe LRU store of read-only DataFrames with TTL and memory cap.
+
+    Frames handed out by the store are shared between sessions and must not be
+    modified in place; derive new frames (or views) instead.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the SharedFrameStore.
+
+        Args:
+            ttl_seconds: Seconds after which an entry is reloaded
+            max_bytes: Total DataFrame memory kept before least recently used entries are dropped
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry has outlived the TTL."""
+        return time.monotonic() - entry["loaded_at"] > self.ttl_seconds
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove an entry; the caller must hold the store lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry["nbytes"]
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """
+        Get a shared frame.
+
+        Args:
+            key: Cache key of the frame
+
+        Returns:
+            pandas.DataFrame: The shared frame, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                self._drop(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry["df"]
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store a shared frame, evicting least recently used entries over the memory cap.
+
+        Args:
+            key: Cache key of the frame
+            df: Frame to share
+
+        Returns:
+            pandas.DataFrame: The stored frame
+        """
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            self._store(key, df, nbytes, time.monotonic())
+        return df
+
+    def extend(self, key: Hashable, df: pd.DataFrame, added_nbytes: int) -> pd.DataFrame:
+        """
+        Replace a shared frame with a grown version of itself, e.g. after rows were appended.
+
+        The entry's size is increased by ``added_nbytes`` instead of measuring
+        the whole frame again, and its TTL is not reset. If the entry is gone
+        (expired or evicted) the frame is stored as by put.
+
+        Args:
+            key: Cache key of the frame
+            df: Frame replacing the stored one
+            added_nbytes: Memory added to the stored frame
+
+        Returns:
+            pandas.DataFrame: The stored frame
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._store(key, df, entry["nbytes"] + added_nbytes, entry["loaded_at"])
+                return df
+        return self.put(key, df)
+
+    def _store(self, key: Hashable, df: pd.DataFrame, nbytes: int, loaded_at: float) -> None:
+        """Add an entry and evict over the memory cap; the caller must hold the store lock."""
+        self._drop(key)
+        self._entries[key] = {"df": df, "nbytes": nbytes, "loaded_at": loaded_at}
+        self._total_bytes += nbytes
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """
+        Get a shared frame, loading it once if missing.
+
+        Concurrent sessions asking for the same missing key wait for a single
+        load instead of each loading their own copy.
+
+        Args:
+            key: Cache key of the frame
+            loader: Callable producing the frame; a None result is not cached
+
+        Returns:
+            pandas.DataFrame: The shared frame, or None if the loader returned None
+        """
+        df = self.get(key)
+        if df is not None:
+            return df
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            df = self.get(key)
+            if df is None:
+                df = loader()
+                if df is not None:
+                    self.put(key, df)
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return df
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> List[pd.DataFrame]:
+        """
+        Drop shared frames.
+
+        Args:
+            predicate: Drop only keys for which this returns True; None drops everything
+
+        Returns:
+            list: The dropped frames
+        """
+        dropped = []
+        with self._lock:
+            for key in list(self._entries):
+                if predicate is None or predicate(key):
+                    dropped.append(self._entries[key]["df"])
+                    self._drop(key)
+        return dropped
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry count, memory use and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# Module-level store: modules are imported once per process, so every session shares it
+frame_store = SharedFrameStore()
+
+
+@st.cache_resource
+def get_shared_blob_util(connection_string: str, container_name: str):
+    """
+    Get the process-wide BlobAccessUtil for a container.
+
+    Args:
+        connection_string: Azure Storage connection string
+        container_name: Name of the blob container
+
+    Returns:
+        BlobAccessUtil: Shared blob utility instance
+    """
+    from utils.blobaccess import BlobAccessUtil
+    return BlobAccessUtil(connection_string, container_name)
@@ -24,8 +24,8 @@ def select_clinician():
 
     if selection != st.session_state.clinician_name:
         st.session_state.clinician_name = selection
-        for key in ["metrics_data", "filtered_metrics"]:
-            st.session_state.pop(key, None)
+        # Metrics frames are shared and only their links depend on the clinician
+        st.session_state.pop("filtered_metrics", None)
 
     return selection
 